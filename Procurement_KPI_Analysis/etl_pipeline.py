@@ -2,16 +2,31 @@
 
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Iterable, Iterator
+import numpy as np
 import pandas as pd
-import pandas_gbq
+import pyarrow as pa
 import kagglehub
+from google.cloud import bigquery
 from dataframe_tools import DataFrameInspector
 
 # Configuration
 DATASET = "shahriarkabir/procurement-kpi-analysis-dataset"
 PROJECT_ID = "vivid-alchemy-388523"
 DEST_TABLE = "Procurement_KPI_Sample.data"
+CHUNK_SIZE = 200_000  # Rows per CSV chunk read and loaded into BigQuery
+CSV_CACHE_TTL = 24 * 60 * 60  # Seconds a previously extracted CSV is reused before re-downloading
+CSV_FILENAME = DATASET.split('/')[-1] + ".csv"  # Name the dataset's CSV is extracted to, so the cache never picks up other files
+VERBOSE = os.environ.get("ETL_VERBOSE") == "1"  # Set ETL_VERBOSE=1 to print a DataFrame summary
+
+# Low-cardinality text columns held as categoricals to save memory and serialization time
+CATEGORY_COLUMNS = ['Supplier', 'Item_Category', 'Order_Status', 'Compliance']
+
+# Columns loaded into BigQuery DATE fields
+DATE_COLUMNS = ['Order_Date', 'Delivery_Date', 'Order_Week_Start', 'Order_Month', 'Delivery_Week_Start', 'Delivery_Month']
 
 SCHEMA = [
     {'name': 'PO_ID', 'type': 'STRING'},
@@ -31,6 +46,9 @@ SCHEMA = [
     {'name': 'Delivery_Month', 'type': 'DATE'},
 ]
 
+# Built once at import so every upload reuses the same field objects
+BQ_SCHEMA = [bigquery.SchemaField(field['name'], field['type']) for field in SCHEMA]
+
 def download_kaggle_dataset(dataset_name: str) -> str:
     print("⬇️ Downloading dataset from Kaggle...")
     dataset_path = kagglehub.dataset_download(dataset_name)
@@ -42,54 +60,106 @@ def extract_csv(dataset_path: str) -> str:
     for file in os.listdir(dataset_path):
         if file.endswith('.csv'):
             source = os.path.join(dataset_path, file)
-            dest = os.path.join(os.getcwd(), file)
-            shutil.move(source, dest)
-            print(f"✅ Found and moved CSV file to: {dest}")
+            dest = os.path.join(os.getcwd(), CSV_FILENAME)
+            # Copy rather than move so the kagglehub cache stays intact for later runs
+            shutil.copy(source, dest)
+            print(f"✅ Found and copied CSV file to: {dest}")
             return dest
     raise FileNotFoundError("❌ No CSV file found in the dataset folder")
 
-def preprocess_dataframe(csv_file: str) -> pd.DataFrame:
-    print("📊 Loading CSV into pandas DataFrame...")
-    df = pd.read_csv(csv_file)
-    print(f"✅ DataFrame loaded with shape: {df.shape}")
-    
-    print("🧪 Generating summary of the DataFrame...")
-    summary = DataFrameInspector(df).generate_summary()
-    print(summary)
-
-    print("🗓️ Converting date columns...")
-    df['Order_Date'] = pd.to_datetime(df['Order_Date'])
-    df['Delivery_Date'] = pd.to_datetime(df['Delivery_Date'])
-
-    print("🧮 Adding time period columns...")
-    df['Order_Week_Start'] = df['Order_Date'].dt.to_period('W-SAT').dt.start_time
-    df['Order_Month'] = df['Order_Date'].dt.to_period('M').dt.start_time
-    df['Delivery_Week_Start'] = df['Delivery_Date'].dt.to_period('W-SAT').dt.start_time
-    df['Delivery_Month'] = df['Delivery_Date'].dt.to_period('M').dt.start_time
-
-    print("📌 Sample of date columns:")
-    print(df[['Order_Date', 'Order_Week_Start', 'Order_Month', 'Delivery_Date', 'Delivery_Week_Start', 'Delivery_Month']].head())
-    
-    return df
-
-def upload_to_bigquery(df: pd.DataFrame, table: str, project: str, schema: list):
-    print("🚀 Uploading DataFrame to BigQuery...")
-    pandas_gbq.to_gbq(
-        df,
-        table,
-        project_id=project,
-        if_exists='replace',
-        table_schema=schema,
-        progress_bar=True
+def find_cached_csv(directory: str, ttl: int = CSV_CACHE_TTL):
+    """Return the CSV extract_csv wrote to `directory` if modified within `ttl` seconds, or None."""
+    # Only the dataset's own extract qualifies; any other CSV here would replace the table on upload
+    path = os.path.join(directory, CSV_FILENAME)
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+        return path
+    return None
+
+def _week_start_sat(dates: pd.Series) -> np.ndarray:
+    """Sunday start of each date's W-SAT week, computed with datetime64 arithmetic."""
+    days = dates.values.astype('datetime64[D]')
+    # 1970-01-01 was a Thursday, so Sunday-based weekdays are offset by 3 days from the epoch
+    offset = (days.view('i8') - 3) % 7
+    week_start = days - offset.astype('timedelta64[D]')
+    week_start[np.isnat(days)] = np.datetime64('NaT')
+    return week_start
+
+def _month_start(dates: pd.Series) -> np.ndarray:
+    """First day of each date's month, computed with datetime64 arithmetic."""
+    return dates.values.astype('datetime64[M]').astype('datetime64[D]')
+
+def _as_date32(days: np.ndarray) -> pd.arrays.ArrowExtensionArray:
+    """Wrap day-resolution datetimes as an Arrow date32 array so Parquet carries DATE natively."""
+    return pd.arrays.ArrowExtensionArray(pa.array(days.astype('datetime64[D]'), from_pandas=True))
+
+def _augment(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Add week and month start columns derived from the order and delivery dates."""
+    chunk['Order_Week_Start'] = _week_start_sat(chunk['Order_Date'])
+    chunk['Order_Month'] = _month_start(chunk['Order_Date'])
+    chunk['Delivery_Week_Start'] = _week_start_sat(chunk['Delivery_Date'])
+    chunk['Delivery_Month'] = _month_start(chunk['Delivery_Date'])
+    # Down-cast to dates up front so the load job does not convert timestamps to DATE on ingest
+    for col in DATE_COLUMNS:
+        chunk[col] = _as_date32(chunk[col].values)
+    return chunk
+
+def preprocess_dataframe(csv_file: str, chunksize: int = CHUNK_SIZE, verbose: bool = False) -> Iterator[pd.DataFrame]:
+    print(f"📊 Streaming CSV into pandas DataFrames of up to {chunksize} rows...")
+    # Reading in chunks keeps peak memory proportional to the chunk, not the whole file
+    reader = pd.read_csv(
+        csv_file,
+        chunksize=chunksize,
+        parse_dates=['Order_Date', 'Delivery_Date'],
+        dtype={col: 'category' for col in CATEGORY_COLUMNS},
+        engine="c"
     )
-    print(f"✅ Data uploaded to BigQuery table `{table}`")
+    for i, chunk in enumerate(reader):
+        print(f"✅ Chunk {i + 1} loaded with shape: {chunk.shape}")
+        if i == 0 and verbose:
+            print("🧪 Generating summary of the first chunk...")
+            summary = DataFrameInspector(chunk).generate_summary()
+            print(summary)
+
+        chunk = _augment(chunk)
+
+        if i == 0:
+            print("📌 Sample of date columns:")
+            print(chunk[['Order_Date', 'Order_Week_Start', 'Order_Month', 'Delivery_Date', 'Delivery_Week_Start', 'Delivery_Month']].head())
+        yield chunk
+
+def upload_to_bigquery(chunks: Iterable[pd.DataFrame], table: str, project: str, schema: list, client: bigquery.Client = None):
+    print("🚀 Uploading DataFrame chunks to BigQuery...")
+    # Each chunk is one Parquet load job; the first replaces the table and the rest append to it
+    if client is None:
+        client = bigquery.Client(project=project)
+    write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
+    total_rows = 0
+    for chunk in chunks:
+        job_config = bigquery.LoadJobConfig(
+            schema=schema,
+            write_disposition=write_disposition,
+            source_format=bigquery.SourceFormat.PARQUET,
+        )
+        load_job = client.load_table_from_dataframe(chunk, table, job_config=job_config)
+        load_job.result()
+        total_rows += load_job.output_rows
+        write_disposition = bigquery.WriteDisposition.WRITE_APPEND
+    print(f"✅ Data uploaded to BigQuery table `{table}` ({total_rows} rows)")
 
 def main():
     print("🔄 Starting ETL pipeline for Procurement KPI Analysis...")
-    dataset_path = download_kaggle_dataset(DATASET)
-    csv_file = extract_csv(dataset_path)
-    df = preprocess_dataframe(csv_file)
-    upload_to_bigquery(df, DEST_TABLE, PROJECT_ID, SCHEMA)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Resolve BigQuery credentials in the background while the dataset is fetched
+        client_future = executor.submit(bigquery.Client, project=PROJECT_ID)
+        csv_file = find_cached_csv(os.getcwd())
+        if csv_file:
+            print(f"♻️ Reusing cached CSV file: {csv_file}")
+        else:
+            dataset_path = download_kaggle_dataset(DATASET)
+            csv_file = extract_csv(dataset_path)
+        client = client_future.result()
+    chunks = preprocess_dataframe(csv_file, verbose=VERBOSE)
+    upload_to_bigquery(chunks, DEST_TABLE, PROJECT_ID, BQ_SCHEMA, client=client)
     print("🎉 Done")
 
 if __name__ == "__main__":
@@ -1,7 +1,14 @@
 #scrapeX.py
+import hashlib
+import html
 import json
+import os
+import re
+import tempfile
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -10,10 +17,52 @@ from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, ElementClickInterceptedException
 import threading
 import keyboard
 import logging
+import logging.handlers
+
+# Optional faster JSON backends; the stdlib json module is used when they are missing
+try:
+    import ijson
+    HAVE_IJSON = True
+except ImportError:
+    HAVE_IJSON = False
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAVE_BLOOM = True
+except ImportError:
+    HAVE_BLOOM = False
+try:
+    import httpx
+    HAVE_HTTPX = True
+except ImportError:
+    HAVE_HTTPX = False
+try:
+    import h2  # noqa: F401 -- enables HTTP/2 in httpx
+    HAVE_HTTP2 = True
+except ImportError:
+    HAVE_HTTP2 = False
+
+JSON_LOAD_ERRORS = (json.JSONDecodeError, ijson.JSONError) if HAVE_IJSON else (json.JSONDecodeError,)
+
+logger = logging.getLogger(__name__)
+
+
+def _post_key(date_time, profile_name, tweet_text):
+    """Compact 16-byte digest identifying a post for duplicate checking."""
+    return hashlib.blake2b(f"{date_time}\0{profile_name}\0{tweet_text}".encode(), digest_size=16).digest()
+
+
+def _json_line(obj):
+    """Serialize an object to a single line of JSON bytes."""
+    return orjson.dumps(obj) if HAVE_ORJSON else json.dumps(obj).encode()
 
 
 # This code defines a `ScrapeX` class that is used to scrape tweets from X. 
@@ -42,7 +91,61 @@ class ScrapeX:
     CARET_SELECTOR = '[role="button"][data-testid="caret"]'
     ENGAGEMENT_MENU_SELECTOR = '[role="menuitem"][data-testid="tweetEngagements"]'
 
-    def __init__(self, username, password, target_url, time_limit, existing_posts_path=None, do_scrape_engagements=False, headless=False):
+    # Matches "<count> <label>" pairs in a stats aria-label, e.g. "1,234 likes"
+    _STATS_RE = re.compile(r'(\d[\d,]*)\s+([A-Za-z]+)')
+    # Canonical stats keys shared by the DOM and API scrapers; the aria-label uses the singular for a count of 1
+    _STATS_KEYS = {'reply': 'replies', 'repost': 'reposts', 'retweet': 'reposts', 'retweets': 'reposts',
+                   'like': 'likes', 'bookmark': 'bookmarks', 'view': 'views'}
+
+    # Extracts the fields of every tweet element passed in a single WebDriver round-trip
+    POST_DATA_SCRIPT = """
+        return arguments[0].map(tweet => {
+            const name = tweet.querySelector('[data-testid="User-Name"] span span');
+            const time = tweet.querySelector('time');
+            const link = time ? time.closest('a[href*="/status/"]') : null;
+            const text = tweet.querySelector('[data-testid="tweetText"]');
+            const group = tweet.querySelector('[role="group"]');
+            return {
+                element: tweet,
+                status_url: link ? link.href : null,
+                profile_name: name ? name.innerText : null,
+                date_time: time ? time.getAttribute('datetime') : null,
+                tweet_text: text ? text.innerText : null,
+                stats: group ? group.getAttribute('aria-label') : null
+            };
+        });
+    """
+
+    # GraphQL search endpoint used by the X web client. The query ID rotates when X redeploys;
+    # update it from the browser's network tab if requests start returning 404.
+    SEARCH_TIMELINE_URL = 'https://x.com/i/api/graphql/nK1dw4oV3k4w5TdtcAdSww/SearchTimeline'
+    # Consecutive 429 responses waited out before API scraping gives up
+    API_MAX_RATE_LIMIT_RETRIES = 5
+    # Public bearer token embedded in the X web client
+    API_BEARER_TOKEN = 'AAAAAAAAAAAAAAAAAAAAANRILgAAAAAAnNwIzUejRCOuH5E6I8xnZz4puTs%3D1Zv7ttfk8LF81IUq16cHjhLTvJu4FA33AGWWjCpTnA'
+    API_FEATURES = {
+        'responsive_web_graphql_exclude_directive_enabled': True,
+        'verified_phone_label_enabled': False,
+        'responsive_web_graphql_timeline_navigation_enabled': True,
+        'responsive_web_graphql_skip_user_profile_image_extensions_enabled': False,
+        'creator_subscriptions_tweet_preview_api_enabled': True,
+        'tweetypie_unmention_optimization_enabled': True,
+        'responsive_web_edit_tweet_api_enabled': True,
+        'graphql_is_translatable_rweb_tweet_is_translatable_enabled': True,
+        'view_counts_everywhere_api_enabled': True,
+        'longform_notetweets_consumption_enabled': True,
+        'responsive_web_twitter_article_tweet_consumption_enabled': False,
+        'tweet_awards_web_tipping_enabled': False,
+        'freedom_of_speech_not_reach_fetch_enabled': True,
+        'standardized_nudges_misinfo': True,
+        'tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled': True,
+        'longform_notetweets_rich_text_read_enabled': True,
+        'longform_notetweets_inline_media_enabled': True,
+        'responsive_web_media_download_video_enabled': False,
+        'responsive_web_enhance_cards_enabled': False,
+    }
+
+    def __init__(self, username, password, target_url, time_limit, existing_posts_path=None, do_scrape_engagements=False, headless=False, use_api=False):
         """
         Initialize the scraper with necessary parameters.
 
@@ -54,6 +157,8 @@ class ScrapeX:
             existing_posts_path (str, optional): Path to JSON file with existing posts for duplicate checking.
             do_scrape_engagements (bool): Whether to scrape engagements for each tweet.
             headless (bool): Whether to run the webdriver in headless mode. Defaults to False.
+            use_api (bool): Whether to scrape via the SearchTimeline GraphQL endpoint after logging in,
+                instead of scrolling the page. Requires httpx and does not support engagements. Defaults to False.
         """
         self.username = username
         self.password = password
@@ -62,10 +167,15 @@ class ScrapeX:
         self.existing_posts_path = existing_posts_path
         self.do_scrape_engagements = do_scrape_engagements
         self.headless = headless
+        self.use_api = use_api
         self.driver = None
-        self.existing_posts_set = set()  # For duplicate checking
-        self.existing_posts_list = []    # To retain full data for output
+        self.existing_posts_set = self._new_dedup_filter()  # Post key digests for duplicate checking
+        self.existing_posts_count = 0
+        self.existing_posts_spool = None  # Temp NDJSON copy of existing posts, streamed into the output
         self.scraped_posts = []
+        self.seen_status_urls = set()  # Permalinks already processed, skipped on later scrolls
+        self.ndjson_path = None  # Append-only log of new posts, written as they are scraped
+        self._out_fh = None
         self.start_time = None
         self.wrap_up_time = None
         self.stop_scraping = False
@@ -75,9 +185,11 @@ class ScrapeX:
         hours, minutes, seconds = map(int, time_limit_str.split(':'))
         return hours * 3600 + minutes * 60 + seconds
 
-    def _setup_driver(self):
+    def _setup_driver(self, driver_path=None):
         """Set up the Firefox WebDriver with optional headless mode."""
-        service = Service(GeckoDriverManager().install())
+        if driver_path is None:
+            driver_path = GeckoDriverManager().install()
+        service = Service(driver_path)
         options = FirefoxOptions()
         if self.headless:
             options.add_argument("--headless")  # Enable headless mode if requested
@@ -109,47 +221,71 @@ class ScrapeX:
                 login_button.click()
             home_link = self._wait_on_element(5, By.CSS_SELECTOR, '[data-testid="AppTabBar_Home_Link"]')
             if home_link != 'error':
-                logging.info("Logged in successfully.")
+                logger.info("Logged in successfully.")
                 return True
-        logging.warning("Failed to log in after 3 attempts.")
+        logger.warning("Failed to log in after 3 attempts.")
         return False
 
     def _load_target(self):
         """Navigate to the target URL and wait for tweets to load."""
         self.driver.get(self.target_url)
         self._wait_on_elements(10, By.CSS_SELECTOR, self.TWEET_SELECTOR)
-        logging.info(f"Loaded target URL: {self.target_url}")
+        logger.info(f"Loaded target URL: {self.target_url}")
+
+    def _new_dedup_filter(self):
+        """
+        Create the duplicate-checking structure.
+
+        A scalable Bloom filter keeps memory at a few bytes per post for large archives;
+        its rare false positives only skip a post. Falls back to an exact set without pybloom_live.
+        """
+        if HAVE_BLOOM:
+            return ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+        return set()
 
     def _load_existing_posts(self):
         """Load existing posts from JSON file for duplicate checking and inclusion in output."""
         if not self.existing_posts_path:
             return
         try:
-            with open(self.existing_posts_path, 'r') as f:
-                tweets = json.load(f)
-                self.existing_posts_list = tweets  # Keep the full list of existing posts
+            with open(self.existing_posts_path, 'rb') as f, \
+                    tempfile.NamedTemporaryFile('wb', suffix='.ndjson', delete=False) as spool:
+                self.existing_posts_spool = spool.name
+                # Stream posts one at a time when ijson is available instead of parsing the whole file first
+                tweets = ijson.items(f, 'item', use_float=True) if HAVE_IJSON else json.load(f)
                 for tweet in tweets:
-                    tweet_tuple = (tweet['date_time'], tweet['profile_name'], tweet['tweet_text'])
-                    self.existing_posts_set.add(tweet_tuple)  # Add to set for duplicate checking
-            print(f"Loaded {len(self.existing_posts_set)} existing posts.")
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+                    self.existing_posts_set.add(_post_key(tweet['date_time'], tweet['profile_name'], tweet['tweet_text']))
+                    spool.write(_json_line(tweet) + b"\n")  # Spool to disk rather than keeping every post in memory
+                    self.existing_posts_count += 1
+            print(f"Loaded {self.existing_posts_count} existing posts.")
+        except (FileNotFoundError, *JSON_LOAD_ERRORS) as e:
             print(f"Error loading existing posts: {e}")
-            self.existing_posts_list = []  # Reset to empty list on error
+            self._discard_existing_posts_spool()
+            self.existing_posts_set = self._new_dedup_filter()
+            self.existing_posts_count = 0
+
+    def _discard_existing_posts_spool(self):
+        """Remove the temporary NDJSON copy of existing posts, if any."""
+        if self.existing_posts_spool and os.path.exists(self.existing_posts_spool):
+            os.remove(self.existing_posts_spool)
+        self.existing_posts_spool = None
+
+    def _quit_driver(self):
+        """Close the browser, if it is still running."""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
 
     def _scrape_posts(self):
         """Main scraping loop."""
-        self._load_existing_posts()
         self.start_time = time.time()
         self.wrap_up_time = self.start_time + self.time_limit_seconds
         total_posts, tries, duplicates, stagnation_counter = 0, 0, 0, 0
         last_known_post_count = 0
-        logging.info("Starting scraping.")
+        logger.info("Starting scraping.")
 
         try:
             while time.time() < self.wrap_up_time and not self.stop_scraping:
-                print(f"Time Remaining: {self._get_remaining_time()}")
-                print("Fetching posts...")
-
                 # Fetch current visible tweets
                 tweets = self._wait_on_elements(3, By.CSS_SELECTOR, self.TWEET_SELECTOR)
                 if tweets == 'error':
@@ -157,32 +293,43 @@ class ScrapeX:
                     if action == 'Retry':
                         continue
                 else:
-                    print(f"Found {len(tweets)} posts.")
-                    # Process tweets dynamically without assuming a fixed range
-                    current_tweets = self.driver.find_elements(By.CSS_SELECTOR, self.TWEET_SELECTOR)
-                    for tweet in current_tweets:
+                    # Extract the waited-on tweets in one script call rather than re-querying the DOM
+                    try:
+                        raw_posts = self.driver.execute_script(self.POST_DATA_SCRIPT, tweets)
+                    except StaleElementReferenceException:
+                        print("Stale posts before extraction. Refetching...")
+                        continue
+                    for raw_post in raw_posts:
+                        status_url = raw_post.pop('status_url')
+                        if status_url in self.seen_status_urls:
+                            continue  # Already handled on a previous scroll
                         tries += 1
+                        tweet = raw_post.pop('element')
                         try:
-                            post_data = self._get_post_data(tweet)
+                            post_data = self._get_post_data(raw_post)
                             if post_data:
-                                post_tuple = (post_data['date_time'], post_data['profile_name'], post_data['tweet_text'])
-                                if post_tuple not in self.existing_posts_set:
-                                    self.existing_posts_set.add(post_tuple)
-                                    print(f"{total_posts + 1}. {post_data['date_time']} - {post_data['profile_name']} - {post_data['tweet_text']}")
+                                if status_url:
+                                    self.seen_status_urls.add(status_url)
+                                post_key = _post_key(post_data['date_time'], post_data['profile_name'], post_data['tweet_text'])
+                                if post_key not in self.existing_posts_set:
+                                    self.existing_posts_set.add(post_key)
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"{total_posts + 1}. {post_data['date_time']} - {post_data['profile_name']} - {post_data['tweet_text']}")
                                     if self.do_scrape_engagements:
                                         post_data['engagements'] = self._get_engagements(tweet)
                                     self.scraped_posts.append(post_data)
+                                    self._append_ndjson(post_data)
                                     total_posts += 1
                                 else:
                                     duplicates += 1
                             else:
-                                print(f"Failed to scrape post {tries}.")
+                                logger.debug(f"Failed to scrape post {tries}.")
                         except StaleElementReferenceException:
                             print(f"Stale element at attempt {tries}. Skipping...")
                             continue
                         except Exception as e:
                             print(f"Unexpected error in post scraping: {e}")
-                            self.save_posts(filename=f'data_partial_{int(time.time())}.json')  # Save partial data
+                            self._save_partial()  # Save partial data
                             raise  # Re-raise to exit loop but after saving
 
                 # Stagnation check
@@ -193,49 +340,183 @@ class ScrapeX:
                     stagnation_counter += 1
                     if stagnation_counter >= 20:
                         print("No new posts for 20 attempts. Aborting...")
-                        logging.info("Aborted due to stagnation: no new posts for 20 attempts.")
+                        logger.info("Aborted due to stagnation: no new posts for 20 attempts.")
                         break
 
-                # Scroll and wait for DOM to stabilize
-                self.driver.execute_script('window.scrollBy(0, window.innerHeight);')
-                time.sleep(1.5)  # Allow DOM to update after scroll
-                print(f"Posts: {total_posts} | Tries: {tries} | Duplicates: {duplicates}")
+                # Scroll and wait until new tweets render instead of sleeping a fixed interval
+                self._scroll_and_wait(3)
+                # One progress line per scroll rather than per tweet
+                progress = f"Time Remaining: {self._get_remaining_time()} | Posts: {total_posts} | Tries: {tries} | Duplicates: {duplicates}"
+                print(progress)
+                logger.info(progress)
 
             print(f"Scraped {total_posts} posts | Tries: {tries} | Duplicates: {duplicates}")
-            logging.info(f"Scraping finished. Scraped {total_posts} posts | Tries: {tries} | Duplicates: {duplicates}")
+            logger.info(f"Scraping finished. Scraped {total_posts} posts | Tries: {tries} | Duplicates: {duplicates}")
         except Exception as e:
             print(f"Error in _scrape_posts: {e}")
-            logging.error(f"Error in _scrape_posts: {e}")
-            self.save_posts(filename=f'data_partial_{int(time.time())}.json')  # Save before exiting
+            logger.error(f"Error in _scrape_posts: {e}")
+            self._save_partial()  # Save before exiting
             raise  # Re-raise to propagate the error up to run()
+        finally:
+            self._flush_log()
+
+    def _build_api_client(self):
+        """Build an httpx client authenticated with the logged-in browser session's cookies."""
+        cookies = {cookie['name']: cookie['value'] for cookie in self.driver.get_cookies()}
+        headers = {
+            'authorization': f'Bearer {self.API_BEARER_TOKEN}',
+            'x-csrf-token': cookies.get('ct0', ''),
+            'x-twitter-auth-type': 'OAuth2Session',
+            'x-twitter-active-user': 'yes',
+            'user-agent': self.driver.execute_script('return navigator.userAgent;'),
+        }
+        return httpx.Client(http2=HAVE_HTTP2, headers=headers, cookies=cookies, timeout=15)
+
+    def _search_variables(self, cursor=None):
+        """Build SearchTimeline variables from the query string of the target URL."""
+        params = parse_qs(urlparse(self.target_url).query)
+        variables = {
+            'rawQuery': params.get('q', [''])[0],
+            'count': 20,
+            'querySource': params.get('src', ['typed_query'])[0],
+            'product': 'Latest' if params.get('f', [''])[0] == 'live' else 'Top',
+        }
+        if cursor:
+            variables['cursor'] = cursor
+        return variables
 
-    def _get_post_data(self, tweet):
-        """Extract data from a tweet element with retry mechanism."""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                username_elem = tweet.find_element(By.CSS_SELECTOR, self.USERNAME_SELECTOR)
-                profile_name = username_elem.find_element(By.TAG_NAME, 'span').find_element(By.TAG_NAME, 'span').text
-                date_time = tweet.find_element(By.TAG_NAME, 'time').get_attribute('datetime')
-                tweet_text = self._clean_string(tweet.find_element(By.CSS_SELECTOR, self.TWEET_TEXT_SELECTOR).text)
-                stats = tweet.find_element(By.CSS_SELECTOR, '[role="group"]').get_attribute('aria-label')
-                stat_dict = self._stats_to_dict(stats) if stats else {}
-                return {
-                    'date_time': date_time,
-                    'profile_name': profile_name,
-                    'tweet_text': tweet_text,
-                    'stats': stat_dict
-                }
-            except StaleElementReferenceException:
-                if attempt < max_retries - 1:
-                    print(f"Stale element in _get_post_data, retrying ({attempt + 1}/{max_retries})...")
-                    time.sleep(0.5)
+    def _fetch_search_page(self, client, cursor=None):
+        """
+        Fetch one SearchTimeline page, waiting out rate limits.
+
+        Returns None instead of waiting when the reset falls after the time limit, the run was
+        aborted, or API_MAX_RATE_LIMIT_RETRIES waits in a row were not enough.
+        """
+        params = {
+            'variables': json.dumps(self._search_variables(cursor)),
+            'features': json.dumps(self.API_FEATURES),
+        }
+        for attempt in range(self.API_MAX_RATE_LIMIT_RETRIES + 1):
+            response = client.get(self.SEARCH_TIMELINE_URL, params=params)
+            if response.status_code != 429:
+                response.raise_for_status()
+                return response.json()
+            reset = int(response.headers.get('x-rate-limit-reset', time.time() + 60))
+            wait = max(1, reset - int(time.time()))
+            if (attempt == self.API_MAX_RATE_LIMIT_RETRIES or self.stop_scraping
+                    or time.time() + wait >= self.wrap_up_time):
+                break
+            print(f"Rate limited. Waiting {wait}s...")
+            logger.info(f"Rate limited by SearchTimeline; waiting {wait}s.")
+            time.sleep(wait)
+        logger.info("Rate limited by SearchTimeline; giving up on this page.")
+        return None
+
+    def _parse_search_page(self, payload):
+        """Return (posts, bottom_cursor) from a SearchTimeline response."""
+        instructions = payload['data']['search_by_raw_query']['search_timeline']['timeline']['instructions']
+        posts, cursor = [], None
+        for instruction in instructions:
+            entries = instruction.get('entries') or ([instruction['entry']] if 'entry' in instruction else [])
+            for entry in entries:
+                content = entry.get('content', {})
+                if content.get('cursorType') == 'Bottom':
+                    cursor = content.get('value')
                     continue
-                print("Max retries reached for stale element. Skipping this tweet.")
-                return None
-            except (NoSuchElementException, TimeoutException) as e:
-                print(f"Error extracting tweet data: {e}")
-                return None
+                result = content.get('itemContent', {}).get('tweet_results', {}).get('result')
+                post_data = self._tweet_result_to_post(result) if result else None
+                if post_data:
+                    posts.append(post_data)
+        return posts, cursor
+
+    def _tweet_result_to_post(self, result):
+        """Map a GraphQL tweet result to the same post_data shape the DOM scraper produces."""
+        if result.get('__typename') == 'TweetWithVisibilityResults':
+            result = result['tweet']
+        legacy = result.get('legacy')
+        user = result.get('core', {}).get('user_results', {}).get('result', {}).get('legacy', {})
+        if not legacy or not user.get('name') or not legacy.get('full_text'):
+            return None
+        created_at = datetime.strptime(legacy['created_at'], '%a %b %d %H:%M:%S %z %Y')
+        counts = {
+            'replies': legacy.get('reply_count'),
+            'reposts': legacy.get('retweet_count'),
+            'likes': legacy.get('favorite_count'),
+            'bookmarks': legacy.get('bookmark_count'),
+            'views': result.get('views', {}).get('count'),
+        }
+        # The aria-label omits zero counts, so drop them here too to keep both modes' stats identical
+        stats = {key: int(count) for key, count in counts.items() if count and int(count)}
+        return {
+            'date_time': created_at.strftime('%Y-%m-%dT%H:%M:%S.000Z'),  # Matches the <time datetime> format
+            'profile_name': user['name'],
+            # The API escapes &, < and > in full_text; the DOM text does not, and dedup keys must match
+            'tweet_text': self._clean_string(html.unescape(legacy['full_text'])),
+            'stats': stats
+        }
+
+    def _scrape_posts_api(self, client):
+        """Scraping loop that pages through the SearchTimeline GraphQL endpoint instead of the DOM."""
+        self.start_time = time.time()
+        self.wrap_up_time = self.start_time + self.time_limit_seconds
+        total_posts, tries, duplicates, empty_pages = 0, 0, 0, 0
+        cursor = None
+        logger.info("Starting API scraping.")
+
+        try:
+            while time.time() < self.wrap_up_time and not self.stop_scraping:
+                payload = self._fetch_search_page(client, cursor)
+                if payload is None:
+                    print("Rate limited beyond the time limit or retry cap. Stopping...")
+                    logger.info("API scraping stopped: rate limited.")
+                    break
+                posts, next_cursor = self._parse_search_page(payload)
+                new_on_page = 0
+                for post_data in posts:
+                    tries += 1
+                    post_key = _post_key(post_data['date_time'], post_data['profile_name'], post_data['tweet_text'])
+                    if post_key in self.existing_posts_set:
+                        duplicates += 1
+                        continue
+                    self.existing_posts_set.add(post_key)
+                    self.scraped_posts.append(post_data)
+                    self._append_ndjson(post_data)
+                    total_posts += 1
+                    new_on_page += 1
+
+                progress = f"Time Remaining: {self._get_remaining_time()} | Posts: {total_posts} | Tries: {tries} | Duplicates: {duplicates}"
+                print(progress)
+                logger.info(progress)
+
+                empty_pages = 0 if new_on_page else empty_pages + 1
+                if not next_cursor or next_cursor == cursor or empty_pages >= 5:
+                    print("No more new posts from the search timeline. Stopping...")
+                    logger.info("API scraping stopped: search timeline exhausted.")
+                    break
+                cursor = next_cursor
+
+            print(f"Scraped {total_posts} posts | Tries: {tries} | Duplicates: {duplicates}")
+            logger.info(f"Scraping finished. Scraped {total_posts} posts | Tries: {tries} | Duplicates: {duplicates}")
+        except Exception as e:
+            print(f"Error in _scrape_posts_api: {e}")
+            logger.error(f"Error in _scrape_posts_api: {e}")
+            self._save_partial()  # Save before exiting
+            raise  # Re-raise to propagate the error up to run()
+        finally:
+            self._flush_log()
+
+    def _get_post_data(self, raw_post):
+        """Build post data from the fields returned by POST_DATA_SCRIPT."""
+        if not all(raw_post[field] for field in ('profile_name', 'date_time', 'tweet_text')):
+            logger.debug("Missing fields in extracted tweet data.")
+            return None
+        stats = raw_post['stats']
+        return {
+            'date_time': raw_post['date_time'],
+            'profile_name': raw_post['profile_name'],
+            'tweet_text': self._clean_string(raw_post['tweet_text']),
+            'stats': self._stats_to_dict(stats) if stats else {}
+        }
 
     def _get_engagements(self, tweet):
         """Scrape engagements for a tweet."""
@@ -275,8 +556,9 @@ class ScrapeX:
                                 engagements.append(text)
                         except:
                             continue
-                    self.driver.execute_script('window.scrollBy(0, window.innerHeight);')
-                    time.sleep(0.5)
+                    # Stop once a scroll loads nothing new, which is how every engagement list ends
+                    if not self._scroll_and_wait(0.5):
+                        break
 
                 self.driver.close()
                 self.driver.switch_to.window(self.driver.window_handles[0])
@@ -325,65 +607,173 @@ class ScrapeX:
         except:
             return 'error'
 
+    def _scroll_and_wait(self, timeout):
+        """Scroll one viewport and wait up to `timeout` seconds for new tweets; returns whether any rendered."""
+        previous = self.driver.find_elements(By.CSS_SELECTOR, self.TWEET_SELECTOR)
+        self.driver.execute_script('window.scrollBy(0, window.innerHeight);')
+
+        def new_tweets_rendered(driver):
+            # The timeline is virtualized, so a new last tweet counts as progress even if the total stays flat
+            current = driver.find_elements(By.CSS_SELECTOR, self.TWEET_SELECTOR)
+            return len(current) > len(previous) or (current and previous and current[-1] != previous[-1])
+
+        try:
+            WebDriverWait(self.driver, timeout).until(new_tweets_rendered)
+            return True
+        except TimeoutException:
+            return False  # Nothing new rendered; the caller's stagnation or scroll limits handle this
+
     def _get_remaining_time(self):
         """Calculate remaining time as a string."""
-        remaining = int(self.wrap_up_time - time.time())
-        hours, remainder = divmod(remaining, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02}:{minutes:02}:{seconds:02}"
+        return str(timedelta(seconds=max(0, int(self.wrap_up_time - time.time()))))
 
     def _clean_string(self, text):
         """Clean and trim a string."""
         return text.replace('\n', '').replace('\r', '').strip() if text else None
 
     def _stats_to_dict(self, stats):
-        """Convert stats string to a dictionary."""
-        parts = stats.split(', ')
-        return {part.split(' ', 1)[1]: int(part.split(' ', 1)[0]) for part in parts}
+        """Convert stats string to a dictionary keyed by the canonical stats names."""
+        return {self._STATS_KEYS.get(label.lower(), label.lower()): int(count.replace(',', ''))
+                for count, label in self._STATS_RE.findall(stats)}
 
-    def generate_json_filename(self, prefix="post_data"):
+    def generate_json_filename(self, prefix="post_data", extension="json"):
         """Generates a timestamped filename for the output JSON file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        return f"{prefix}_{timestamp}.json"
+        return f"{prefix}_{timestamp}.{extension}"
+
+    def _open_ndjson_output(self):
+        """Open the append-only NDJSON file that receives each new post as it is scraped."""
+        self.ndjson_path = self.generate_json_filename(extension="ndjson")
+        self._out_fh = open(self.ndjson_path, 'ab')
+
+    def _close_ndjson_output(self):
+        """Close the NDJSON output file, if open."""
+        if self._out_fh:
+            self._out_fh.close()
+            self._out_fh = None
+
+    def _append_ndjson(self, post_data):
+        """Append one post to the NDJSON output so it is on disk without rewriting the archive."""
+        if self._out_fh:
+            self._out_fh.write(_json_line(post_data) + b"\n")
+            self._out_fh.flush()
+
+    def _save_partial(self):
+        """Preserve posts scraped so far after an error."""
+        if self._out_fh:
+            # Every new post is already on disk, so there is nothing to rewrite
+            self._out_fh.flush()
+            print(f"New posts scraped so far are saved in {self.ndjson_path}.")
+            logger.info(f"Partial data available in {self.ndjson_path}")
+        else:
+            self.save_posts(filename=f'data_partial_{int(time.time())}.json')
 
     def save_posts(self, filename=None):
         """Save both existing and newly scraped posts to a JSON file."""
         if filename is None:
             filename = self.generate_json_filename()  # Use generated filename if none provided
-        # Combine existing posts with newly scraped posts
-        all_posts = self.existing_posts_list + self.scraped_posts
-        with open(filename, 'w') as f:
-            json.dump(all_posts, f, indent=4)
-        print(f"Saved {len(all_posts)} posts (including {len(self.existing_posts_list)} existing and {len(self.scraped_posts)} new) to {filename}.")
-        logging.info(f"Data saved to {filename}")
+        # Stream existing posts from the spool, then the new posts, as a JSON array with one post per line
+        with open(filename, 'wb') as f:
+            f.write(b"[")
+            separator = b"\n"
+            for line in self._iter_existing_post_lines():
+                f.write(separator + line)
+                separator = b",\n"
+            for post in self.scraped_posts:
+                f.write(separator + _json_line(post))
+                separator = b",\n"
+            f.write(b"\n]\n")
+        total = self.existing_posts_count + len(self.scraped_posts)
+        print(f"Saved {total} posts (including {self.existing_posts_count} existing and {len(self.scraped_posts)} new) to {filename}.")
+        logger.info(f"Data saved to {filename}")
         return filename
 
+    def _iter_existing_post_lines(self):
+        """Yield each spooled existing post as a line of JSON bytes."""
+        if not self.existing_posts_spool:
+            return
+        with open(self.existing_posts_spool, 'rb') as spool:
+            for line in spool:
+                yield line.rstrip(b"\n")
+
     def _listen_for_abort(self):
         """Listen for the 'q' key press to abort scraping."""
         keyboard.wait('q')  # Blocks until 'q' is pressed
         self.stop_scraping = True
+        logger.info("Abort requested.")
+        self._flush_log()
+
+    def _configure_logging(self):
+        """Route scraper logs through a memory buffer that writes to scrape_log.txt in batches."""
+        # Release the previous run's handlers before the log file is reopened; MemoryHandler.close
+        # drops its target without closing it, so the file handler is closed explicitly
+        for handler in list(logger.handlers):
+            target = getattr(handler, 'target', None)
+            handler.flush()
+            handler.close()
+            if target is not None:
+                target.close()
+        logger.handlers.clear()
+        # Overwrite the log file each run
+        file_handler = logging.FileHandler('scrape_log.txt', mode='w')
+        memory_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+        logger.addHandler(memory_handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    def _flush_log(self):
+        """Write any buffered log records to the log file."""
+        for handler in logger.handlers:
+            handler.flush()
 
     def run(self):
         """Execute the full scraping process."""
-        # Configure logging to overwrite the log file each time
-        logging.basicConfig(filename='scrape_log.txt', level=logging.INFO, filemode='w')
-        logging.info("Beginning scrapeX run.")
-        self._setup_driver()
-        if not self._login():
-            self.driver.quit()
-            return
-        self._load_target()
-        print("Beginning scrape. Press 'q' to abort and save collected data.")
-        abort_thread = threading.Thread(target=self._listen_for_abort, daemon=True)
-        abort_thread.start()
-        self._scrape_posts()
-        output_filename = self.save_posts()  # Use generated filename by default
-        self.driver.quit()
+        self._configure_logging()
+        logger.info("Beginning scrapeX run.")
+        # Fail before launching Firefox and logging in, not after
+        if self.use_api and not HAVE_HTTPX:
+            raise ImportError("use_api=True requires httpx (pip install httpx).")
+        # The browser and the spooled copy of the archive are released however the run ends
+        try:
+            # Install GeckoDriver and load existing posts concurrently; both are I/O-bound
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                driver_path = executor.submit(GeckoDriverManager().install)
+                existing_posts = executor.submit(self._load_existing_posts)
+                existing_posts.result()
+                self._setup_driver(driver_path.result())
+            if not self._login():
+                return
+            client = None
+            if self.use_api:
+                if self.do_scrape_engagements:
+                    print("Engagement scraping is not supported in API mode and will be skipped.")
+                # The browser is only needed for login; the session cookies carry over to the API client
+                client = self._build_api_client()
+                self._quit_driver()
+            else:
+                self._load_target()
+            print("Beginning scrape. Press 'q' to abort and save collected data.")
+            abort_thread = threading.Thread(target=self._listen_for_abort, daemon=True)
+            abort_thread.start()
+            self._open_ndjson_output()
+            try:
+                if client:
+                    with client:
+                        self._scrape_posts_api(client)
+                else:
+                    self._scrape_posts()
+            finally:
+                self._close_ndjson_output()
+            # One-shot conversion to a JSON array (existing + new) for consumers that expect it
+            output_filename = self.save_posts()  # Use generated filename by default
+        finally:
+            self._quit_driver()
+            self._discard_existing_posts_spool()
         print(f"Scraping completed. Data saved to {output_filename}.")
+        self._flush_log()
 
 
 if __name__ == "__main__":
-    import os
     xun = os.environ['xun']
     xpw = os.environ['xpw']
     scraper = ScrapeX(
@@ -64,6 +64,13 @@ def parse_args():
         help='Run browser in non-headless mode (visible window)'
     )
 
+    parser.add_argument(
+        '--use-api',
+        '-a',
+        action='store_true',
+        help='After logging in, fetch posts from the search API instead of scrolling the page (requires httpx)'
+    )
+
     return parser.parse_args()
 
 if __name__ == "__main__":
@@ -81,6 +88,7 @@ if __name__ == "__main__":
         time_limit=args.time_limit,
         existing_posts_path=args.existing_posts,
         do_scrape_engagements=args.scrape_engagements,
-        headless=args.headless
+        headless=args.headless,
+        use_api=args.use_api
     )
     scraper.run()
\ No newline at end of file
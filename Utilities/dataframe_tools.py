@@ -6,88 +6,251 @@ from google.cloud import monitoring_v3
 import seaborn as sns
 import matplotlib.pyplot as plt
 import numpy as np
-import random # for pivot table darts
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional Storage Read API client for faster BigQueryExtractor downloads
+try:
+    from google.cloud import bigquery_storage
+    HAVE_BQSTORAGE = True
+except ImportError:
+    HAVE_BQSTORAGE = False
+
+# Optional JIT compiler for the PivotTable_AutoConfig numba engine
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Optional lazy query engine for the PivotTable_AutoConfig polars engine
+try:
+    import polars as pl
+    HAVE_POLARS = True
+except ImportError:
+    HAVE_POLARS = False
+
+# Optional GPU DataFrame library for the PivotTable_AutoConfig cudf engine
+try:
+    import cudf
+    HAVE_CUDF = True
+except ImportError:
+    HAVE_CUDF = False
+
+
+# Expression templates used to code-generate a single mask function per PivotTable filter set;
+# {series} is the column, so nullable dtypes compare with pandas' NA semantics
+_FILTER_EXPRS = {
+    '==': '({series} == {val})',
+    '!=': '({series} != {val})',
+    '>': '({series} > {val})',
+    '<': '({series} < {val})',
+    '>=': '({series} >= {val})',
+    '<=': '({series} <= {val})',
+    # Series.isin matches mixed-type lists element by element, where np.isin would coerce them to one dtype
+    'in': '{series}.isin({val})',
+}
+
+# BigQuery field types keyed on NumPy dtype kind; any other kind loads as STRING
+_KIND_TO_BQ = {
+    'i': 'INTEGER',
+    'u': 'INTEGER',
+    'f': 'FLOAT',
+    'b': 'BOOLEAN',
+    'M': 'TIMESTAMP',
+}
+
+# Aggregations that are valid on non-numeric value columns
+COUNT_AGGFUNCS = {'count', 'nunique'}
+
+# How partial aggregates over a finer grouping combine into a coarser one; mean is rebuilt from sum and count
+ROLLUP_AGGFUNCS = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'}
+
+# Aggregations the polars engine evaluates; each name is also a polars expression method
+POLARS_AGGFUNCS = {'sum', 'mean', 'count', 'min', 'max'}
+
+# Aggregations the cudf engine runs as GPU hash-groupby reductions
+CUDF_AGGFUNCS = {'sum', 'mean', 'count', 'min', 'max'}
+
+# Aggregations the numba pivot kernel implements, mapped to the op codes it switches on
+PIVOT_KERNEL_OPS = {'sum': 0, 'mean': 1, 'count': 2, 'min': 3, 'max': 4}
+
+# Aggregations _pivot_bincount scatters with NumPy alone, so engine='numba' keeps a kernel path without numba installed
+BINCOUNT_KERNEL_OPS = {'sum', 'mean', 'count'}
+
+def _pivot_kernel(idx_codes, col_codes, values, n_idx, n_cols, op):
+    """
+    Scatter-aggregate values into an (n_idx, n_cols) grid addressed by factorized row and column codes.
 
+    Rows with a missing key (code -1) are skipped and NaN values are ignored, matching pandas groupby.
+    Cells with no rows come out as NaN, as do mean/min/max cells whose values were all NaN.
+    """
+    n_cells = n_idx * n_cols
+    out = np.zeros(n_cells)
+    counts = np.zeros(n_cells, dtype=np.int64)
+    seen = np.zeros(n_cells, dtype=np.bool_)
+    for i in range(values.shape[0]):
+        r = idx_codes[i]
+        c = col_codes[i]
+        if r < 0 or c < 0:
+            continue
+        cell = r * n_cols + c
+        seen[cell] = True
+        v = values[i]
+        if np.isnan(v):
+            continue
+        if op == 3:
+            if counts[cell] == 0 or v < out[cell]:
+                out[cell] = v
+        elif op == 4:
+            if counts[cell] == 0 or v > out[cell]:
+                out[cell] = v
+        else:
+            out[cell] += v
+        counts[cell] += 1
+    for cell in range(n_cells):
+        if not seen[cell]:
+            out[cell] = np.nan
+        elif op == 1 or op == 3 or op == 4:
+            if counts[cell] == 0:
+                out[cell] = np.nan
+            elif op == 1:
+                out[cell] /= counts[cell]
+        elif op == 2:
+            out[cell] = counts[cell]
+    return out.reshape((n_idx, n_cols))
+
+# Compiled once per environment; nogil lets concurrent pivots run the kernel in parallel threads
+_pivot_numba = njit(cache=True, nogil=True)(_pivot_kernel) if HAVE_NUMBA else None
+
+def _pivot_bincount(idx_codes, col_codes, values, n_idx, n_cols, op):
+    """
+    NumPy counterpart of _pivot_kernel for sum, mean and count, scattering with np.bincount.
+
+    Takes the same arguments and returns the same grid as _pivot_kernel for op codes 0-2.
+    """
+    n_cells = n_idx * n_cols
+    cells = idx_codes * n_cols + col_codes
+    keyed = (idx_codes >= 0) & (col_codes >= 0)
+    seen = np.bincount(cells[keyed], minlength=n_cells) > 0
+    present = keyed & ~np.isnan(values)
+    counts = np.bincount(cells[present], minlength=n_cells)
+    if op == 2:
+        out = counts.astype(np.float64)
+    else:
+        out = np.bincount(cells[present], weights=values[present], minlength=n_cells)
+        if op == 1:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                out /= counts
+    out[~seen] = np.nan
+    return out.reshape((n_idx, n_cols))
 
 class DataFrameInspector:
     def __init__(self, df: pd.DataFrame):
         """Initialize with a DataFrame."""
         self.df = df
 
-    def _get_column_data_types(self):
-        """Returns a dictionary of column data types."""
-        return self.df.dtypes.to_dict()
+    def _get_observed_values(self, col):
+        """
+        Returns the distinct non-null values of a categorical or boolean column, read from the
+        category codes or the boolean buffer instead of hashing the data. Returns None for other dtypes.
+        """
+        series = self.df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories
+            codes = series.cat.codes.to_numpy()
+            present = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+            return categories[present]
+        if series.dtype == bool:
+            values = series.to_numpy()
+            return np.array([flag for flag, seen in ((True, values.any()), (False, not values.all())) if seen])
+        return None
+
+    @staticmethod
+    def _non_null_unique(series):
+        """
+        Returns unique values in order of appearance, dropping nulls from the small result instead of the input.
+        Series.unique keeps pandas scalar types, so datetimes stay Timestamps with their timezone.
+        """
+        uniques = series.unique()
+        return uniques[~pd.isna(uniques)]
 
     def _get_unique_counts(self):
-        """Returns a dictionary of the number of unique values per column."""
-        return self.df.nunique().to_dict()
-
-    def _get_missing_counts(self):
-        return self.df.isnull().sum().to_dict()
-
-    def _get_unique_value_examples(self, limit=10):
+        """Returns a Series of the number of unique values per column."""
+        shortcut_counts = {}
+        for col in self.df.columns:
+            observed = self._get_observed_values(col)
+            if observed is not None:
+                shortcut_counts[col] = len(observed)
+        if not shortcut_counts:
+            return self.df.nunique()
+        other_cols = [col for col in self.df.columns if col not in shortcut_counts]
+        counts = self.df[other_cols].nunique().to_dict()
+        counts.update(shortcut_counts)
+        return pd.Series(counts, dtype='int64').reindex(self.df.columns)
+
+    def _get_unique_value_examples(self, nunique_series=None, limit=10):
         """
-        Returns a dictionary of unique value examples (up to `limit` values).
+        Returns a Series of unique value examples (up to `limit` values) per column.
         If a column has more unique values, appends a note.
+        Reuses a precomputed `nunique_series` when given instead of rescanning each column.
         """
+        if nunique_series is None:
+            nunique_series = self._get_unique_counts()
+        probe_rows = max(limit * 20, 1000)
         unique_examples = {}
         for col in self.df.columns:
-            unique_vals = self.df[col].dropna().unique()[:limit]  # Get up to `limit` unique values
+            n = nunique_series[col]
+            unique_vals = self._get_observed_values(col)
+            if unique_vals is not None:
+                unique_vals = unique_vals[:limit]
+            elif n > limit:
+                # Probe a bounded prefix first; high-cardinality columns usually fill `limit` quickly
+                unique_vals = self._non_null_unique(self.df[col].iloc[:probe_rows])[:limit]
+                if len(unique_vals) < limit:
+                    unique_vals = None
+            if unique_vals is None:
+                unique_vals = self._non_null_unique(self.df[col])[:limit]  # Get up to `limit` unique values
             unique_str = ", ".join(map(str, unique_vals))
-            if self.df[col].nunique() > limit:
-                extra_count = self.df[col].nunique() - limit
-                unique_str += f" (+ {extra_count} more...)"
+            if n > limit:
+                unique_str += f" (+ {n - limit} more...)"
             unique_examples[col] = unique_str
-        return unique_examples
+        return pd.Series(unique_examples)
 
     def _get_numeric_summary_stats(self):
-        """Returns stats for numeric columns; others get None."""
-        stats = {
-            'min': {}, 'max': {}, 'mean': {}, 'std': {},
-            '25%': {}, '50%': {}, '75%': {}
-        }
-
-        for col in self.df.columns:
-            if pd.api.types.is_numeric_dtype(self.df[col]):
-                series = self.df[col]
-                try:
-                    stats['min'][col] = series.min()
-                    stats['max'][col] = series.max()
-                    stats['mean'][col] = series.mean()
-                    stats['std'][col] = series.std()
-                    stats['25%'][col] = series.quantile(0.25)
-                    stats['50%'][col] = series.quantile(0.50)
-                    stats['75%'][col] = series.quantile(0.75)
-                except Exception:
-                    for key in stats:
-                        stats[key][col] = None
-            else:
-                for key in stats:
-                    stats[key][col] = None
-
-        return stats
+        """Returns a DataFrame of stats indexed by numeric column; other columns are absent."""
+        numeric = self.df.select_dtypes(include='number')
+        if numeric.columns.empty:
+            return pd.DataFrame(columns=['min', 'max', 'mean', 'std', '25%', '50%', '75%'], dtype=float)
+        stats = numeric.agg(['min', 'max', 'mean', 'std']).T
+        quantiles = numeric.quantile([0.25, 0.50, 0.75]).T
+        quantiles.columns = ['25%', '50%', '75%']
+        return stats.join(quantiles)
 
     def generate_summary(self):
         """Generates a DataFrame with descriptive stats per column."""
-        dtypes = self._get_column_data_types()
-        unique_counts = self._get_unique_counts()
-        missing_counts = self._get_missing_counts()
-        unique_examples = self._get_unique_value_examples()
-        numeric_stats = self._get_numeric_summary_stats()
+        dtypes = self.df.dtypes
+        columns = dtypes.index
+        nunique_series = self._get_unique_counts()  # One hash pass per column, shared with the examples
+        missing_counts = self.df.isnull().sum()
+        unique_examples = self._get_unique_value_examples(nunique_series)
+        numeric_stats = self._get_numeric_summary_stats().reindex(columns).astype(float)
 
         summary_df = pd.DataFrame({
-            "Column": list(dtypes.keys()),
-            "Data Type": list(dtypes.values()),
-            "Missing Values": [missing_counts[col] for col in dtypes],
-            "Unique Values": [unique_counts[col] for col in dtypes],
-            "Unique Examples": [unique_examples[col] for col in dtypes],
-            "Min": [numeric_stats['min'][col] for col in dtypes],
-            "25%": [numeric_stats['25%'][col] for col in dtypes],
-            "50%": [numeric_stats['50%'][col] for col in dtypes],
-            "75%": [numeric_stats['75%'][col] for col in dtypes],
-            "Max": [numeric_stats['max'][col] for col in dtypes],
-            "Mean": [numeric_stats['mean'][col] for col in dtypes],
-            "Std Dev": [numeric_stats['std'][col] for col in dtypes],
+            "Column": columns,
+            "Data Type": dtypes.values,
+            "Missing Values": missing_counts.reindex(columns).values,
+            "Unique Values": nunique_series.reindex(columns).values,
+            "Unique Examples": unique_examples.reindex(columns).values,
+            "Min": numeric_stats['min'].values,
+            "25%": numeric_stats['25%'].values,
+            "50%": numeric_stats['50%'].values,
+            "75%": numeric_stats['75%'].values,
+            "Max": numeric_stats['max'].values,
+            "Mean": numeric_stats['mean'].values,
+            "Std Dev": numeric_stats['std'].values,
         })
 
         return summary_df
@@ -107,6 +270,26 @@ class PivotTable:
         self.values = []  # List of column names to summarize
         self.aggfunc = {}  # Dictionary mapping value columns to aggregation functions
         self.filters = []  # List to store filter conditions
+        self._filter_cache = {}  # Filtered DataFrames keyed on the filter conditions
+        self._pivot_cache = {}  # Pivot results keyed on the full configuration
+        self._compiled_filters = {}  # Generated mask functions keyed on the filter conditions; data-independent
+        self._cache_source = df  # DataFrame the memoized filter and pivot results were computed from
+
+    def _invalidate_cache(self):
+        """Drop memoized filter and pivot results after a configuration change."""
+        self._filter_cache.clear()
+        self._pivot_cache.clear()
+
+    def _sync_cache_source(self):
+        """Drop memoized results if self.df has been reassigned since they were computed."""
+        if self._cache_source is not self.df:
+            self._invalidate_cache()
+            self._cache_source = self.df
+
+    @staticmethod
+    def _freeze(value):
+        """Convert list-valued aggregation settings into hashable tuples for cache keys."""
+        return tuple(value) if isinstance(value, list) else value
 
     def add_row(self, col_name):
         """
@@ -115,6 +298,7 @@ class PivotTable:
         Args:
             col_name (str): Name of the column to add as a row.
         """
+        self._invalidate_cache()
         if col_name not in self.df.columns:
             raise ValueError(f"Column '{col_name}' not found in DataFrame.")
         if col_name not in self.index:
@@ -127,6 +311,7 @@ class PivotTable:
         Args:
             col_name (str): Name of the column to remove from rows.
         """
+        self._invalidate_cache()
         if col_name in self.index:
             self.index.remove(col_name)
         else:
@@ -139,6 +324,7 @@ class PivotTable:
         Args:
             col_name (str): Name of the column to add as a column.
         """
+        self._invalidate_cache()
         if col_name not in self.df.columns:
             raise ValueError(f"Column '{col_name}' not found in DataFrame.")
         if col_name not in self.columns:
@@ -151,6 +337,7 @@ class PivotTable:
         Args:
             col_name (str): Name of the column to remove from columns.
         """
+        self._invalidate_cache()
         if col_name in self.columns:
             self.columns.remove(col_name)
         else:
@@ -164,6 +351,7 @@ class PivotTable:
             col_name (str): Name of the column to summarize.
             aggfunc (str or list): Aggregation function(s) (e.g., 'sum', 'mean', ['sum', 'mean']).
         """
+        self._invalidate_cache()
         if col_name not in self.df.columns:
             raise ValueError(f"Column '{col_name}' not found in DataFrame.")
         if col_name not in self.values:
@@ -179,6 +367,7 @@ class PivotTable:
         Args:
             col_name (str): Name of the column to remove from values.
         """
+        self._invalidate_cache()
         if col_name in self.values:
             self.values.remove(col_name)
             del self.aggfunc[col_name]
@@ -193,6 +382,7 @@ class PivotTable:
             col_name (str): Name of the value column.
             aggfunc (str or list): New aggregation function(s).
         """
+        self._invalidate_cache()
         if col_name in self.values:
             self.aggfunc[col_name] = aggfunc
         else:
@@ -207,28 +397,52 @@ class PivotTable:
             operator (str): The operator to use (e.g., '==', '!=', '>', '<', '>=', '<=', 'in').
             value: The value to compare against. For 'in', provide a list.
         """
+        self._invalidate_cache()
         if col_name not in self.df.columns:
             raise ValueError(f"Column '{col_name}' not found in DataFrame.")
+        if operator not in _FILTER_EXPRS:
+            raise ValueError(f"Unsupported operator '{operator}'.")
+        
+        if operator == 'in' and not isinstance(value, list):
+            raise ValueError("'in' operator requires a list of values.")
         
-        # Construct the filter condition string
+        value = self._coerce_filter_value(col_name, value)
         if operator == 'in':
-            if not isinstance(value, list):
-                raise ValueError("'in' operator requires a list of values.")
-            value_str = repr(value)  # e.g., ['North', 'South']
-        else:
-            value_str = repr(value)  # Handles strings (e.g., 'North') and numbers (e.g., 100)
+            value = tuple(value)  # Stored as a tuple so filter conditions stay hashable
         
-        # Create the condition string with backticks for column names
-        condition = f"`{col_name}` {operator} {value_str}"
-        self.filters.append(condition)
+        self.filters.append((col_name, operator, value))
+
+    def _coerce_filter_value(self, col_name, value):
+        """
+        Cast a filter value to the NumPy dtype of its column once, so mask evaluation compares like types.
+
+        Args:
+            col_name (str): The column the filter applies to.
+            value: The scalar or list of values to compare against.
+
+        Returns:
+            The value as NumPy scalar(s) of the column dtype, or unchanged if the cast is unsupported or lossy.
+        """
+        dtype = self.df[col_name].dtype
+        if not isinstance(dtype, np.dtype) or dtype.kind not in 'iufM':
+            return value
+        try:
+            coerced = np.asarray(value, dtype=dtype)
+        except (TypeError, ValueError, OverflowError):
+            return value
+        # Keep the original when casting would change it, e.g. 2.5 against an integer column
+        if dtype.kind != 'M' and not np.array_equal(coerced, np.asarray(value)):
+            return value
+        return coerced[()] if coerced.ndim == 0 else list(coerced)
 
     def remove_filter(self, condition):
         """
         Remove a specific filter condition from the pivot table.
         
         Args:
-            condition (str): The exact filter condition string to remove.
+            condition (tuple): The exact (col_name, operator, value) filter condition to remove.
         """
+        self._invalidate_cache()
         if condition in self.filters:
             self.filters.remove(condition)
         else:
@@ -238,6 +452,7 @@ class PivotTable:
         """
         Remove all filter conditions from the pivot table.
         """
+        self._invalidate_cache()
         self.filters = []
 
     def _apply_filters(self):
@@ -245,25 +460,57 @@ class PivotTable:
         Apply all filter conditions to the DataFrame and return the filtered result.
         
         Returns:
-            pd.DataFrame: The filtered DataFrame.
+            pd.DataFrame: The filtered DataFrame. It is memoized and shared between calls, so treat it as read-only.
         
         Raises:
             ValueError: If a filter condition is invalid.
         """
         if not self.filters:
             return self.df
-        query_str = " and ".join(self.filters)
+        self._sync_cache_source()
+        key = tuple(self.filters)
+        if key in self._filter_cache:
+            return self._filter_cache[key]
+        mask_func = self._compiled_filters.get(key)
+        if mask_func is None:
+            mask_func = self._compiled_filters[key] = self._compile_filters(key)
         try:
-            return self.df.query(query_str)
+            mask = mask_func(self.df)
         except Exception as e:
             raise ValueError(f"Invalid filter condition: {e}")
+        self._filter_cache[key] = self.df.iloc[mask]
+        return self._filter_cache[key]
+
+    @staticmethod
+    def _compile_filters(filters):
+        """
+        Generate a function that evaluates a set of filter conditions as one fused NumPy mask.
+
+        Args:
+            filters (tuple): Filter conditions as (column, operator, value) tuples.
+
+        Returns:
+            callable: Function taking a DataFrame and returning a boolean NumPy array.
+        """
+        # Column names and values are bound as globals rather than rendered into the source
+        namespace = {'np': np}
+        terms = []
+        for i, (col, op, value) in enumerate(filters):
+            namespace[f'c{i}'] = col
+            namespace[f'v{i}'] = value
+            term = _FILTER_EXPRS[op].format(series=f'df[c{i}]', val=f'v{i}')
+            # A comparison against NA is NA on nullable columns; count it as not matching
+            terms.append(f'{term}.to_numpy(dtype=bool, na_value=False)')
+        source = f"def _mask(df):\n    return {' & '.join(terms)}\n"
+        exec(compile(source, '<pivot_filter>', 'exec'), namespace)
+        return namespace['_mask']
 
     def generate(self):
         """
         Generate the pivot table based on the current configuration and filters.
         
         Returns:
-            pd.DataFrame: The resulting pivot table.
+            pd.DataFrame: The resulting pivot table, a copy the caller is free to modify.
         
         Raises:
             ValueError: If no values are specified, columns overlap, or filters are invalid.
@@ -272,17 +519,31 @@ class PivotTable:
             raise ValueError("Columns cannot be in both rows and columns.")
         if not self.values:
             raise ValueError("No values specified for pivot table.")
+        self._sync_cache_source()
+        
+        # Repeat calls with an unchanged configuration reuse the previous result
+        key = (
+            tuple(self.index), tuple(self.columns), tuple(self.values),
+            frozenset((col, self._freeze(func)) for col, func in self.aggfunc.items()),
+            tuple(self.filters), id(self.df)
+        )
+        if key in self._pivot_cache:
+            return self._pivot_cache[key].copy()
         
         # Apply filters before generating the pivot table
         filtered_df = self._apply_filters()
         
-        return pd.pivot_table(filtered_df, values=self.values, index=self.index, 
-                              columns=self.columns, aggfunc=self.aggfunc)
+        # observed=True keeps categorical keys from expanding into every unused category combination
+        pivot = pd.pivot_table(filtered_df, values=self.values, index=self.index, 
+                               columns=self.columns, aggfunc=self.aggfunc, observed=True)
+        self._pivot_cache[key] = pivot
+        return pivot.copy()
 
     def reset(self):
         """
         Reset the pivot table configuration to its initial state, including filters.
         """
+        self._invalidate_cache()
         self.index = []
         self.columns = []
         self.values = []
@@ -338,13 +599,15 @@ class PivotChart:
         # Set figure size to scale with both columns and rows (8 inches wide per chart)
         fig, axes = plt.subplots(grid_rows, self.grid_cols, figsize=(8 * self.grid_cols, 6 * grid_rows))
         axes = axes.flatten() if num_charts > 1 else [axes]
-        print(f"Axes type before plotting: {type(axes)}")
         
         # Compute font scale as per your adjustment
         if self.auto_fontscale:
             font_scale = min(4, 2 * grid_rows)  # Double font scale per row, capped at 4
         else:
             font_scale = 1
+        title_fontsize = 12 * font_scale
+        axis_label_fontsize = 10 * font_scale
+        tick_fontsize = 8 * font_scale
         
         # Apply color palette if specified
         if self.palette:
@@ -353,21 +616,22 @@ class PivotChart:
         # Plot each pivot table
         for i, (pivot_table, title, ax) in enumerate(zip(self.pivot_tables, self.titles, axes)):
             if i < num_charts:
-                # Flatten multi-index columns for plotting if necessary
+                # Flatten multi-index columns on a relabelled view so the caller's pivot table is left untouched
                 if isinstance(pivot_table.columns, pd.MultiIndex):
-                    pivot_table.columns = ['_'.join(map(str, col)) for col in pivot_table.columns]
+                    flat_cols = ['_'.join(map(str, col)) for col in pivot_table.columns]
+                    plot_df = pivot_table.set_axis(flat_cols, axis=1)
+                else:
+                    flat_cols = pivot_table.columns.tolist()
+                    plot_df = pivot_table
                 
                 # Plot the data
-                plot_result = pivot_table.plot(kind=self.chart_type, title=title, ax=ax, **self.kwargs)
-                print(f"Plot result type for {title}: {type(plot_result)}")
+                plot_df.plot(kind=self.chart_type, title=title, ax=ax, **self.kwargs)
                 
                 # Intelligently set legend labels
                 if ax.get_legend():
-                    # Get column names (flattened if multi-index)
-                    legend_labels = pivot_table.columns.tolist()
-                    # Simplify labels if they’re long or complex
-                    simplified_labels = [label.replace('_', ' ').title() for label in legend_labels]
-                    ax.legend(simplified_labels, fontsize=8 * font_scale, title="Categories", title_fontsize=10 * font_scale)
+                    # Simplify column names (flattened if multi-index) if they’re long or complex
+                    simplified_labels = [label.replace('_', ' ').title() for label in flat_cols]
+                    ax.legend(simplified_labels, fontsize=tick_fontsize, title="Categories", title_fontsize=axis_label_fontsize)
                 
                 # Add data labels if enabled
                 if self.data_labels:
@@ -375,16 +639,13 @@ class PivotChart:
                     self._add_data_labels(ax, effective_label_fontsize)
                 
                 # Explicitly set font sizes for all text elements
-                ax.title.set_fontsize(12 * font_scale)  # Title
-                ax.xaxis.label.set_fontsize(10 * font_scale)  # X-axis label
-                ax.yaxis.label.set_fontsize(10 * font_scale)  # Y-axis label
-                for label in ax.get_xticklabels():  # X-axis tick labels
-                    label.set_fontsize(8 * font_scale)
-                for label in ax.get_yticklabels():  # Y-axis tick labels
-                    label.set_fontsize(8 * font_scale)
+                ax.title.set_fontsize(title_fontsize)  # Title
+                ax.xaxis.label.set_fontsize(axis_label_fontsize)  # X-axis label
+                ax.yaxis.label.set_fontsize(axis_label_fontsize)  # Y-axis label
+                ax.tick_params(axis='both', which='both', labelsize=tick_fontsize)  # Tick labels
                 if ax.get_legend():  # Legend
                     for text in ax.get_legend().get_texts():
-                        text.set_fontsize(8 * font_scale)
+                        text.set_fontsize(tick_fontsize)
             else:
                 ax.set_visible(False)
         
@@ -398,7 +659,6 @@ class PivotChart:
         
         plt.tight_layout()
         plt.show()
-        print(f"Returning axes type: {type(axes)}")
         return axes
 
     def _add_data_labels(self, ax, label_fontsize):
@@ -418,9 +678,11 @@ class BigQueryExtractor:
         project_id (str): The Google Cloud project ID.
     """
     def __init__(self, project_id):
-        """Initialize the extractor with a project ID and create a BigQuery client."""
+        """Initialize the extractor with a project ID and create the BigQuery client."""
         self.project_id = project_id
         self.client = bigquery.Client(project=project_id)
+        self._bqstorage_client = None  # Storage Read API client, created on the first download
+        self._bqstorage_lock = threading.Lock()
 
     def check_api_quota(self):
         client = monitoring_v3.MetricServiceClient()
@@ -445,16 +707,24 @@ class BigQueryExtractor:
             print(f"No datasets found in project '{self.project_id}'.")
             return
 
+        tables_by_dataset = {
+            dataset.dataset_id: list(self.client.list_tables(f"{self.project_id}.{dataset.dataset_id}"))
+            for dataset in datasets
+        }
+        # Fetch table metadata concurrently; each get_table is an independent REST round-trip
+        refs = [table.reference for tables in tables_by_dataset.values() for table in tables]
+        full_tables = {}
+        if refs:
+            with ThreadPoolExecutor(max_workers=min(16, len(refs))) as executor:
+                full_tables = dict(zip(refs, executor.map(self.client.get_table, refs)))
+
         output = [f"Datasets in project '{self.project_id}':"]
-        for dataset in datasets:
-            dataset_id = dataset.dataset_id
+        for dataset_id, tables in tables_by_dataset.items():
             output.append(f"\nDataset: {dataset_id}")
-            tables = list(self.client.list_tables(f"{self.project_id}.{dataset_id}"))
             if tables:
                 output.append("Tables:")
                 for table in tables:
-                    full_table = self.client.get_table(table.reference)
-                    size_bytes = full_table.num_bytes
+                    size_bytes = full_tables[table.reference].num_bytes
                     size_str = self._format_size(size_bytes)
                     output.append(f"  - {table.table_id} ({size_str})")
             else:
@@ -479,16 +749,16 @@ class BigQueryExtractor:
             size_bytes /= 1024
         return f"{size_bytes:.2f} TB"  # Fallback for very large sizes
 
-    def run_query(self, query, parameters=None):
+    def submit_query(self, query, parameters=None):
         """
-        Execute a single BigQuery query and return the result as a Pandas DataFrame.
+        Start a BigQuery query job without waiting for it to finish.
 
         Args:
             query (str): The SQL query to execute.
             parameters (list of tuples, optional): Query parameters as (name, type, value).
 
         Returns:
-            pandas.DataFrame: The query result as a DataFrame.
+            bigquery.QueryJob: The running query job.
         """
         job_config = bigquery.QueryJobConfig()
         if parameters:
@@ -496,31 +766,68 @@ class BigQueryExtractor:
                 bigquery.ScalarQueryParameter(name, param_type, value)
                 for name, param_type, value in parameters
             ]
-        query_job = self.client.query(query, job_config=job_config)
-        return query_job.to_dataframe()
+        return self.client.query(query, job_config=job_config)
+
+    def _get_bqstorage_client(self):
+        """Return the shared Storage Read API client, or None if google-cloud-bigquery-storage is not installed."""
+        if not HAVE_BQSTORAGE:
+            return None
+        # run_queries collects results from several threads; only one of them creates the client
+        with self._bqstorage_lock:
+            if self._bqstorage_client is None:
+                self._bqstorage_client = bigquery_storage.BigQueryReadClient()
+        return self._bqstorage_client
+
+    def _collect(self, query_job):
+        """Wait for a query job and return its result as a Pandas DataFrame."""
+        bqstorage_client = self._get_bqstorage_client()
+        if bqstorage_client is None:
+            # Paged REST download
+            return query_job.to_dataframe(create_bqstorage_client=False)
+        # Query results are downloaded over the Storage Read API (gRPC + Arrow) instead of paged REST calls
+        return query_job.to_dataframe(bqstorage_client=bqstorage_client, create_bqstorage_client=False)
+
+    def run_query(self, query, parameters=None):
+        """
+        Execute a single BigQuery query and return the result as a Pandas DataFrame.
+
+        Args:
+            query (str): The SQL query to execute.
+            parameters (list of tuples, optional): Query parameters as (name, type, value).
 
-    def run_queries(self, query_list):
+        Returns:
+            pandas.DataFrame: The query result as a DataFrame.
+        """
+        return self._collect(self.submit_query(query, parameters))
+
+    def run_queries(self, query_list, max_workers=8):
         """
         Execute multiple BigQuery queries and return a list of Pandas DataFrames.
 
+        All jobs are submitted before any result is read, so BigQuery runs them concurrently
+        and the batch takes about as long as its slowest query.
+
         Args:
             query_list (list): A list of queries (str or dict with 'query' and 'parameters').
+            max_workers (int): Maximum number of threads downloading results at once (default: 8).
 
         Returns:
             list of pandas.DataFrame: A list containing the DataFrame result for each query.
         """
-        results = []
+        requests = []
         for item in query_list:
             if isinstance(item, str):
-                df = self.run_query(item)
+                requests.append((item, None))
             elif isinstance(item, dict):
-                query = item['query']
-                parameters = item.get('parameters', None)
-                df = self.run_query(query, parameters)
+                requests.append((item['query'], item.get('parameters', None)))
             else:
                 raise ValueError("Each item must be a string or a dictionary with 'query' and 'parameters'")
-            results.append(df)
-        return results
+        if not requests:
+            return []
+
+        jobs = [self.submit_query(query, parameters) for query, parameters in requests]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            return list(executor.map(self._collect, jobs))
 
 
 class BigQueryInserter:
@@ -548,21 +855,9 @@ class BigQueryInserter:
         Returns:
             list: List of bigquery.SchemaField objects.
         """
-        schema = []
-        for column, dtype in dataframe.dtypes.items():
-            # Map Pandas dtypes to BigQuery types
-            if pd.api.types.is_integer_dtype(dtype):
-                field_type = "INTEGER"
-            elif pd.api.types.is_float_dtype(dtype):
-                field_type = "FLOAT"
-            elif pd.api.types.is_bool_dtype(dtype):
-                field_type = "BOOLEAN"
-            elif pd.api.types.is_datetime64_any_dtype(dtype):
-                field_type = "TIMESTAMP"
-            else:
-                field_type = "STRING"  # Default for object, string, etc.
-            schema.append(bigquery.SchemaField(column, field_type))
-        return schema
+        # One dict lookup per column on the dtype kind character
+        return [bigquery.SchemaField(column, _KIND_TO_BQ.get(dtype.kind, "STRING"))
+                for column, dtype in zip(dataframe.columns, dataframe.dtypes)]
 
     def create_table(self, dataset_id, table_id, dataframe=None, schema=None, overwrite=False):
         """
@@ -637,8 +932,75 @@ class BigQueryInserter:
         return load_job
 
 
+def _object_array(items):
+    """Build a 1-D object array from a sequence without NumPy unpacking nested items."""
+    array = np.empty(len(items), dtype=object)
+    array[:] = items
+    return array
+
+
+class ConfigBatch(namedtuple('ConfigBatch', ['index', 'columns', 'values', 'aggfunc'])):
+    """
+    Pivot table configurations stored as parallel object arrays, one entry per configuration.
+
+    Each configuration has a single row field, an optional column field (None when absent),
+    a single value field and the aggregation function applied to it.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        """True if the batch holds at least one configuration."""
+        return len(self.index) > 0
+
+    def filter(self, mask):
+        """
+        Keep the configurations selected by a boolean mask.
+
+        Args:
+            mask (np.ndarray): Boolean array with one entry per configuration.
+
+        Returns:
+            ConfigBatch: The selected configurations.
+        """
+        return ConfigBatch(*(field[mask] for field in self))
+
+    def unique(self):
+        """
+        Drop repeated configurations, keeping the first occurrence of each.
+
+        Returns:
+            ConfigBatch: The batch without duplicate (row, column, value, aggfunc) entries.
+        """
+        seen = set()
+        keep = np.ones(len(self.index), dtype=bool)
+        for i, fields in enumerate(zip(*self)):
+            # A list aggfunc such as ['sum', 'mean'] is frozen so the key stays hashable
+            key = tuple(tuple(field) if isinstance(field, list) else field for field in fields)
+            try:
+                keep[i] = key not in seen
+                seen.add(key)
+            except TypeError:
+                continue  # Other unhashable fields are kept without deduplication
+        return self if keep.all() else self.filter(keep)
+
+    def to_dicts(self):
+        """
+        Expand the batch into the dictionary form accepted by PivotTable.
+
+        Returns:
+            list: List of dictionaries, each containing 'index', 'columns', 'values', and 'aggfunc'.
+        """
+        return [{
+            'index': [row],
+            'columns': [] if col is None else [col],
+            'values': [val],
+            'aggfunc': {val: aggfunc}
+        } for row, col, val, aggfunc in zip(self.index, self.columns, self.values, self.aggfunc)]
+
+
 class PivotTable_AutoConfig:
-    def __init__(self, df: pd.DataFrame = None, summary: pd.DataFrame = None, num_configs: int = 1, max_unique: int = 20):
+    def __init__(self, df: pd.DataFrame = None, summary: pd.DataFrame = None, num_configs: int = 1, max_unique: int = 20,
+                 engine: str = None, use_float32: bool = True, max_bytes: int = 200 * 1024 ** 2, seed=None):
         """
         Initialize the PivotTableConfigurator with a DataFrame or summary and configuration parameters.
 
@@ -647,13 +1009,30 @@ class PivotTable_AutoConfig:
             summary (pd.DataFrame, optional): Summary DataFrame from DataFrameInspector.
             num_configs (int): Number of base pivot table configurations to generate (default: 1).
             max_unique (int): Maximum number of unique values for columns to be considered for rows/columns (default: 20).
+            engine (str, optional): Set to 'numba' to JIT-compile aggregations: callables must then follow the
+                                    pandas numba signature f(values, index), and sum/mean/count/min/max over
+                                    numeric columns run in a compiled scatter kernel. Set to 'polars' to
+                                    collect sum/mean/count/min/max pivots from one lazy polars query. Set to 'cudf'
+                                    to copy the DataFrame to the GPU once and aggregate sum/mean/count/min/max
+                                    pivots there (default: None).
+            use_float32 (bool): Downcast float64 value columns to float32, halving the bytes every aggregation
+                                scans. Integer columns are left alone so sums cannot overflow. Set to False to
+                                keep full precision (default: True).
+            max_bytes (int): Largest dense pivot, estimated from the row and column cardinalities at 8 bytes
+                             per cell, that generate_pivot_tables will build; larger ones are skipped. Generated
+                             configurations only use fields with at most max_unique values, so the budget binds
+                             for configurations assigned to last_configs directly or a large max_unique
+                             (default: 200 MB).
+            seed (int or np.random.Generator, optional): Seed or generator for sampling configurations; the same
+                                                         seed reproduces the same sequence of configurations
+                                                         (default: None, unseeded).
 
         Raises:
             ValueError: If neither df nor summary is provided.
         """
         if df is None and summary is None:
             raise ValueError("Either df or summary must be provided.")
-        self.df = df  # Store the DataFrame for later use in pivot table generation
+        self.df = self._contiguous_columns(df) if df is not None else None  # Store the DataFrame for later use in pivot table generation
         if df is not None:
             inspector = DataFrameInspector(df)
             self.summary = inspector.generate_summary()
@@ -661,9 +1040,62 @@ class PivotTable_AutoConfig:
             self.summary = summary
         self.num_configs = num_configs
         self.max_unique = max_unique
+        self.engine = engine
+        if engine == 'cudf' and not HAVE_CUDF:
+            print("cuDF is not installed; pivot tables will be built on the CPU.")
         self.potential_rows_cols = self._identify_potential_rows_columns()
         self.potential_values = self._identify_potential_values()
-        self.last_configs = []  # Class-level variable to store the most recent configurations
+        # Column -> dtype name lookup so aggfunc selection does not rescan the summary
+        self._dtype_by_col = dict(zip(self.summary['Column'], self.summary['Data Type'].astype(str)))
+        self._numeric_set = set(self.potential_values)
+        # Column -> distinct value count, used to size pivots before building them
+        self._nunique = dict(zip(self.summary['Column'], self.summary['Unique Values']))
+        self.max_bytes = max_bytes
+        self._rng = np.random.default_rng(seed)  # Shared by every sampling call, so a seed fixes the whole sequence
+        if use_float32 and self.df is not None:
+            self._downcast_values()
+        self.last_configs = []  # Most recent configurations: a ConfigBatch, or a list of dicts if assigned directly
+        self._grouped_cache = {}  # GroupBy objects shared within one generate_pivot_tables call, then released
+        self._codes = {}  # Column -> (source DataFrame, codes, uniques) from pd.factorize, shared across configurations
+        self._polars_frame = None  # (source DataFrame, polars LazyFrame over it)
+        self._cudf_frame = None  # (source DataFrame, cudf DataFrame copied to the GPU)
+        self._local = threading.local()  # Per-thread PivotTable reused by the generic fallback path within a call
+
+    @staticmethod
+    def _contiguous_columns(df):
+        """
+        Return the DataFrame with every numeric column backed by a C-contiguous array.
+
+        Columns sliced out of a 2-D block (e.g. after a transpose or a copy of an F-ordered frame) are strided
+        views, which slows every aggregation that scans them. The caller's DataFrame is not modified.
+
+        Args:
+            df (pd.DataFrame): The input DataFrame.
+
+        Returns:
+            pd.DataFrame: The same DataFrame if already contiguous, otherwise a shallow copy with contiguous columns.
+        """
+        strided = [col for col, dtype in df.dtypes.items()
+                   if isinstance(dtype, np.dtype) and dtype.kind in 'iufb'
+                   and not df[col].to_numpy().flags['C_CONTIGUOUS']]
+        if not strided:
+            return df
+        df = df.copy(deep=False)
+        for col in strided:
+            df[col] = np.ascontiguousarray(df[col].to_numpy())
+        return df
+
+    def _downcast_values(self):
+        """
+        Narrow the numeric value columns of the stored DataFrame once, before any pivot is built.
+
+        float64 columns become float32. Integer columns keep their width: a group total can exceed
+        the range of the individual values, and 32-bit accumulators would overflow silently.
+        The summary keeps the original dtypes, so aggfunc selection is unaffected.
+        """
+        casts = {col: np.float32 for col in self.potential_values if self.df[col].dtype == np.float64}
+        if casts:
+            self.df = self.df.astype(casts)
 
     def _identify_potential_rows_columns(self):
         """
@@ -690,6 +1122,41 @@ class PivotTable_AutoConfig:
         potential = self.summary[self.summary['Data Type'].astype(str).isin(numeric_types)]
         return potential['Column'].tolist()
 
+    def _sample_selections(self):
+        """
+        Draw the row, column and value fields for num_configs configurations in one vectorized batch.
+
+        Returns:
+            tuple: (rows, cols, vals) object arrays, where cols holds None if fewer than two row/column
+                   candidates exist.
+
+        Raises:
+            ValueError: If there are no suitable row/column or value fields.
+        """
+        if not self.potential_rows_cols or not self.potential_values:
+            raise ValueError("Not enough suitable columns to generate configurations.")
+        pool = _object_array(self.potential_rows_cols)
+        values = _object_array(self.potential_values)
+        rng = self._rng
+        rows = rng.integers(len(pool), size=self.num_configs)
+        vals = values[rng.integers(len(values), size=self.num_configs)]
+        if len(pool) < 2:
+            return pool[rows], np.full(self.num_configs, None, dtype=object), vals
+        # Shifting by 1..len(pool)-1 places draws a column uniformly from the fields other than the row
+        cols = (rows + rng.integers(1, len(pool), size=self.num_configs)) % len(pool)
+        return pool[rows], pool[cols], vals
+
+    def _keep_valid(self, batch):
+        """Drop configurations from a batch that _config_is_valid rejects, e.g. a custom aggfunc on an unsuitable column."""
+        keep = np.array([self._config_is_valid(config) for config in batch.to_dicts()], dtype=bool)
+        return batch if keep.all() else batch.filter(keep)
+
+    def _config_dicts(self):
+        """Return the most recent configurations as dicts, whether generated as a ConfigBatch or assigned as a list."""
+        if isinstance(self.last_configs, ConfigBatch):
+            return self.last_configs.to_dicts()
+        return list(self.last_configs)
+
     def generate_configurations(self, custom_aggfunc=None):
         """
         Generate a specified number of pivot table configurations, optionally with a custom aggregation function.
@@ -698,47 +1165,27 @@ class PivotTable_AutoConfig:
             custom_aggfunc (str or callable, optional): Custom aggregation function to use instead of default logic.
 
         Returns:
-            list: List of dictionaries, each containing 'index', 'columns', 'values', and 'aggfunc' for a PivotTable.
+            ConfigBatch: Parallel arrays of row, column, value and aggfunc per configuration
+                         (use .to_dicts() for a list of PivotTable-style dictionaries).
+
+        Raises:
+            ValueError: If there are no suitable row/column or value fields.
 
         Notes:
             - Ensures row and column selections are distinct.
             - Selects aggregation functions based on value column data types if custom_aggfunc=None.
         """
-        configurations = []
-        for _ in range(self.num_configs):
-            if len(self.potential_rows_cols) >= 2 and len(self.potential_values) >= 1:
-                row = random.choice(self.potential_rows_cols)
-                col = random.choice([c for c in self.potential_rows_cols if c != row])
-                val = random.choice(self.potential_values)
-                if custom_aggfunc:
-                    aggfunc = custom_aggfunc
-                else:
-                    val_dtype = self.summary[self.summary['Column'] == val]['Data Type'].values[0]
-                    aggfunc = 'sum' if 'int' in str(val_dtype) else 'mean' if 'float' in str(val_dtype) else 'sum'
-                configurations.append({
-                    'index': [row],
-                    'columns': [col],
-                    'values': [val],
-                    'aggfunc': {val: aggfunc}
-                })
-            elif len(self.potential_rows_cols) >= 1 and len(self.potential_values) >= 1:
-                row = random.choice(self.potential_rows_cols)
-                val = random.choice(self.potential_values)
-                if custom_aggfunc:
-                    aggfunc = custom_aggfunc
-                else:
-                    val_dtype = self.summary[self.summary['Column'] == val]['Data Type'].values[0]
-                    aggfunc = 'sum' if 'int' in str(val_dtype) else 'mean' if 'float' in str(val_dtype) else 'sum'
-                configurations.append({
-                    'index': [row],
-                    'columns': [],
-                    'values': [val],
-                    'aggfunc': {val: aggfunc}
-                })
-            else:
-                print("Not enough suitable columns to generate configurations.")
-                break
+        rows, cols, vals = self._sample_selections()
+        if custom_aggfunc:
+            aggfuncs = _object_array([custom_aggfunc] * len(vals))
+        else:
+            aggfuncs = _object_array([
+                'sum' if 'int' in val_dtype else 'mean' if 'float' in val_dtype else 'sum'
+                for val_dtype in (self._dtype_by_col[val] for val in vals)
+            ])
         
+        # Sampling with replacement can repeat a configuration; each is built only once
+        configurations = self._keep_valid(ConfigBatch(rows, cols, vals, aggfuncs).unique())
         self.last_configs = configurations  # Store as the most recent configurations
         return configurations
 
@@ -747,54 +1194,34 @@ class PivotTable_AutoConfig:
         Generate configurations with three variations (sum, mean, count) for each base configuration.
 
         Returns:
-            list: List of dictionaries, each containing 'index', 'columns', 'values', and 'aggfunc' for a PivotTable,
-                  with num_configs * 3 total configurations.
-        """
-        base_configs = []
-        aggfuncs = ['sum', 'mean', 'count']
-        
-        # Generate base configurations (row, col, value)
-        for _ in range(self.num_configs):
-            if len(self.potential_rows_cols) >= 2 and len(self.potential_values) >= 1:
-                row = random.choice(self.potential_rows_cols)
-                col = random.choice([c for c in self.potential_rows_cols if c != row])
-                val = random.choice(self.potential_values)
-                base_configs.append({
-                    'index': [row],
-                    'columns': [col],
-                    'values': [val]
-                })
-            elif len(self.potential_rows_cols) >= 1 and len(self.potential_values) >= 1:
-                row = random.choice(self.potential_rows_cols)
-                val = random.choice(self.potential_values)
-                base_configs.append({
-                    'index': [row],
-                    'columns': [],
-                    'values': [val]
-                })
-            else:
-                print("Not enough suitable columns to generate configurations.")
-                break
-        
-        # Generate three variations for each base config
-        configurations = []
-        for base_config in base_configs:
-            val = base_config['values'][0]
-            for aggfunc in aggfuncs:
-                config = base_config.copy()
-                config['aggfunc'] = {val: aggfunc}
-                configurations.append(config)
+            ConfigBatch: Parallel arrays of row, column, value and aggfunc with num_configs * 3 configurations
+                         (use .to_dicts() for a list of PivotTable-style dictionaries).
+
+        Raises:
+            ValueError: If there are no suitable row/column or value fields.
+        """
+        aggfuncs = _object_array(['sum', 'mean', 'count'])
+        
+        # Generate base configurations (row, col, value), then three variations of each
+        rows, cols, vals = self._sample_selections()
+        variants = len(aggfuncs)
+        configurations = self._keep_valid(ConfigBatch(
+            np.repeat(rows, variants), np.repeat(cols, variants), np.repeat(vals, variants),
+            np.tile(aggfuncs, len(vals))
+        ).unique())
         
         self.last_configs = configurations  # Store as the most recent configurations
         return configurations
 
-    def generate_pivot_tables(self, return_configs: bool = False):
+    def generate_pivot_tables(self, return_configs: bool = False, n_jobs: int = None):
         """
         Generate pivot tables using the most recently generated configurations.
 
         Args:
             return_configs (bool): If True, returns a list of tuples (config, pivot_table); 
                                   if False, returns a list of pivot tables (default: False).
+            n_jobs (int, optional): Number of threads building pivot tables concurrently; 1 runs serially
+                                    (default: None, one per CPU).
 
         Returns:
             list: Depending on return_configs, either a list of pivot tables (pd.DataFrame) or 
@@ -805,35 +1232,528 @@ class PivotTable_AutoConfig:
         """
         if self.df is None:
             raise ValueError("A DataFrame must be provided during initialization to generate pivot tables.")
-        if not self.last_configs:
+        configs = self._config_dicts()
+        if not configs:
             raise ValueError("No configurations available. Run generate_configurations or generate_triple_aggfunc_configurations first.")
         
-        results = []
-        for config in self.last_configs:
-            try:
-                # Instantiate PivotTable with the stored DataFrame
-                pt = PivotTable(self.df)
-                
-                # Apply configuration
-                pt.index = config['index']
-                pt.columns = config['columns']
-                pt.values = config['values']
-                pt.aggfunc = config['aggfunc']
-                
-                # Generate the pivot table
-                pivot_table = pt.generate()
-                
-                # Store result based on return_configs flag
-                if return_configs:
-                    results.append((config, pivot_table))
-                else:
-                    results.append(pivot_table)
-            except Exception as e:
-                print(f"Failed to generate pivot table for config {config}: {e}")
+        # A generated configuration has one row and one column field of at most max_unique values each,
+        # so its size is only worth estimating when that bound could exceed the budget
+        check_budget = (not isinstance(self.last_configs, ConfigBatch)
+                        or self.max_unique ** 2 * 8 > self.max_bytes)
+        
+        # Skip invalid configurations up front instead of letting a doomed pivot scan the data and fail
+        valid = {}
+        for position, config in enumerate(configs):
+            if not self._config_is_valid(config):
+                print(f"Skipping invalid pivot table config {config}")
                 continue
+            # A dense pivot over high-cardinality fields can dwarf the source DataFrame
+            estimated_bytes = self._estimated_bytes(config) if check_budget else 0
+            if estimated_bytes > self.max_bytes:
+                print(f"Skipping pivot table config {config}: estimated {estimated_bytes:,} bytes "
+                      f"exceeds max_bytes ({self.max_bytes:,})")
+                continue
+            valid[position] = config
+        
+        self._ensure_categorical()
+        
+        # The polars engine collects every pivot it supports from one query plan; the rest run below
+        pivot_tables = self._polars_pivots(valid) if self.engine == 'polars' and HAVE_POLARS else {}
+        if self.engine == 'cudf' and HAVE_CUDF:
+            pivot_tables = self._cudf_pivots(valid)
+        remaining = {position: config for position, config in valid.items() if position not in pivot_tables}
+        
+        # Every named aggregation requested for the same grouping is computed in one groupby.agg call
+        batch_plan = self._plan_aggregation_batches(config for config in remaining.values() if self._uses_batch(config))
+        
+        # Configurations sharing a grouping run in the same task so they reuse its single aggregation
+        tasks = {}
+        for position, config in remaining.items():
+            key = self._group_key(config) if self._uses_batch(config) else position
+            tasks.setdefault(key, []).append(position)
+        
+        def run_task(positions):
+            batch_results = {}
+            return [(position, self._run_one_config(configs[position], batch_plan, batch_results))
+                    for position in positions]
+        
+        # pandas and NumPy release the GIL inside their grouping and aggregation kernels
+        max_workers = min(n_jobs or os.cpu_count() or 1, len(tasks))
+        try:
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    outputs = list(executor.map(run_task, tasks.values()))
+            else:
+                outputs = [run_task(positions) for positions in tasks.values()]
+        finally:
+            # Each GroupBy holds O(rows) group codes; keeping them past the call would pin that memory
+            self._grouped_cache.clear()
+            # Drop the per-thread PivotTables too, so their pivot caches do not grow across calls
+            self._local = threading.local()
+        pivot_tables.update(pair for output in outputs for pair in output)
+        
+        results = []
+        for position, config in valid.items():
+            pivot_table = pivot_tables[position]
+            # Store result based on return_configs flag
+            if return_configs:
+                results.append((config, pivot_table))
+            else:
+                results.append(pivot_table)
                 
         return results
 
+    def _estimated_bytes(self, config):
+        """
+        Estimate the memory of a configuration's dense pivot from the distinct counts of its row and column fields.
+
+        Args:
+            config (dict): Pivot table configuration, already checked by _config_is_valid.
+
+        Returns:
+            int: Upper bound on the result size at 8 bytes per cell.
+        """
+        cells = len(config['values'])
+        for col in config['index'] + config['columns']:
+            # Python ints, so high-cardinality products cannot overflow
+            cells *= max(int(self._nunique[col]), 1)
+        return cells * 8
+
+    def _run_one_config(self, config, batch_plan, batch_results):
+        """
+        Build the pivot table for a single configuration, already checked by _config_is_valid,
+        with the fastest applicable backend.
+
+        Args:
+            config (dict): Pivot table configuration.
+            batch_plan (dict): Aggregations per grouping from _plan_aggregation_batches.
+            batch_results (dict): Grouped aggregations already computed in this task, keyed like batch_plan.
+
+        Returns:
+            pd.DataFrame: The pivot table.
+        """
+        if self._use_numba(config):
+            return self._numba_pivot(config)
+        if self._use_pivot_kernel(config):
+            return self._kernel_pivot(config)
+        if self._uses_batch(config):
+            key = self._group_key(config)
+            plan = batch_plan[key]
+            if key not in batch_results:
+                batch_results[key] = self._get_grouped(key, plan).agg(plan['funcs'])
+            if plan['rollup']:
+                aggregated = self._rollup(batch_results[key], config)
+            else:
+                aggregated = batch_results[key][list(config['aggfunc'].items())].droplevel(1, axis=1)
+            return self._reshape_pivot(aggregated, config['columns'])
+
+        pt = self._get_pivot_table()
+        
+        # Apply configuration; PivotTable keys its pivot cache on the full configuration
+        pt.index = config['index']
+        pt.columns = config['columns']
+        pt.values = config['values']
+        pt.aggfunc = config['aggfunc']
+        
+        # Generate the pivot table
+        return pt.generate()
+
+    def _get_pivot_table(self):
+        """
+        Return this thread's PivotTable over the stored DataFrame, creating it on first use.
+
+        One instance per thread lets concurrent tasks set a configuration without racing each other.
+        The instances only live for one generate_pivot_tables call.
+
+        Returns:
+            PivotTable: PivotTable bound to self.df.
+        """
+        pt = getattr(self._local, 'pivot_table', None)
+        if pt is None:
+            pt = self._local.pivot_table = PivotTable(self.df)
+        pt.df = self.df  # PivotTable drops its memoized results when its frame changes
+        return pt
+
+    def _polars_pivots(self, configs):
+        """
+        Build the pivots polars supports with one collect_all call, so shared scans of the frame are planned together.
+
+        Args:
+            configs (dict): Valid configurations keyed on their position in last_configs.
+
+        Returns:
+            dict: Pivot tables keyed on position, for the configurations whose aggfuncs are all in POLARS_AGGFUNCS.
+        """
+        supported = {position: config for position, config in configs.items()
+                     if all(isinstance(func, str) and func in POLARS_AGGFUNCS for func in config['aggfunc'].values())}
+        if not supported:
+            return {}
+        # Holding the source frame keeps its id from being reused by a later self.df
+        if self._polars_frame is None or self._polars_frame[0] is not self.df:
+            self._polars_frame = (self.df, pl.from_pandas(self.df).lazy())
+        lazy_frame = self._polars_frame[1]
+
+        plans = []
+        for config in supported.values():
+            keys = config['index'] + config['columns']
+            aggregations = []
+            for val in config['values']:
+                func = config['aggfunc'][val]
+                expr = getattr(pl.col(val), func)()
+                # polars counts as UInt32; match the int64 counts pandas returns
+                aggregations.append((expr.cast(pl.Int64) if func == 'count' else expr).alias(val))
+            # pandas drops rows with a missing key, while polars would keep them as a null group
+            plans.append(lazy_frame.drop_nulls(keys).group_by(keys).agg(aggregations))
+
+        pivot_tables = {}
+        for (position, config), frame in zip(supported.items(), pl.collect_all(plans)):
+            keys = config['index'] + config['columns']
+            aggregated = frame.to_pandas()
+            for key in keys:
+                # polars orders categories by first appearance; restore the source frame's order
+                if isinstance(self.df[key].dtype, pd.CategoricalDtype):
+                    aggregated[key] = aggregated[key].cat.set_categories(self.df[key].cat.categories)
+            aggregated = aggregated.set_index(keys)
+            pivot_tables[position] = self._reshape_pivot(aggregated, config['columns'])
+        return pivot_tables
+
+    def _cudf_pivots(self, configs):
+        """
+        Aggregate the pivots cuDF supports on the GPU, reusing one device copy of the DataFrame for every configuration.
+
+        Args:
+            configs (dict): Valid configurations keyed on their position in last_configs.
+
+        Returns:
+            dict: Pivot tables keyed on position, for the configurations whose aggfuncs are all in CUDF_AGGFUNCS.
+        """
+        supported = {position: config for position, config in configs.items()
+                     if all(isinstance(func, str) and func in CUDF_AGGFUNCS for func in config['aggfunc'].values())}
+        if not supported:
+            return {}
+        # Holding the source frame keeps its id from being reused by a later self.df
+        if self._cudf_frame is None or self._cudf_frame[0] is not self.df:
+            self._cudf_frame = (self.df, cudf.from_pandas(self.df))
+        gpu_frame = self._cudf_frame[1]
+
+        pivot_tables = {}
+        for position, config in supported.items():
+            keys = config['index'] + config['columns']
+            # Only the small grouped result is copied back; the unstack into pivot layout runs on the CPU
+            aggregated = (gpu_frame[keys + config['values']]
+                          .groupby(keys, sort=False, dropna=True)
+                          .agg(config['aggfunc'])
+                          .to_pandas())
+            for val in config['values']:
+                # cuDF's result dtypes (e.g. int32 counts) differ from pandas'
+                result = aggregated[val].to_numpy(dtype='float64', na_value=np.nan)
+                dtype = self._kernel_result_dtype(config['aggfunc'][val], self.df[val].dtype, result)
+                aggregated[val] = aggregated[val].astype(dtype)
+            pivot_tables[position] = self._reshape_pivot(aggregated[config['values']], config['columns'])
+        return pivot_tables
+
+    def _config_is_valid(self, config):
+        """
+        Check a configuration against the known columns and dtypes before any pivot work is done.
+
+        Args:
+            config (dict): Pivot table configuration.
+
+        Returns:
+            bool: True if all fields exist, rows and columns do not overlap, every value has an aggfunc,
+                  and values are numeric unless only counted or aggregated by a callable.
+        """
+        if not config['values'] or set(config['index']) & set(config['columns']):
+            return False
+        if any(col not in self._dtype_by_col for col in config['index'] + config['columns'] + config['values']):
+            return False
+        for val in config['values']:
+            funcs = config['aggfunc'].get(val)
+            if funcs is None:
+                return False
+            funcs = funcs if isinstance(funcs, list) else [funcs]
+            if all(callable(func) or func in COUNT_AGGFUNCS for func in funcs):
+                continue
+            if self.df is not None:
+                numeric = pd.api.types.is_numeric_dtype(self.df[val])
+            else:
+                numeric = val in self._numeric_set
+            if not numeric:
+                return False
+        return True
+
+    def _use_numba(self, config):
+        """
+        Check whether a configuration should be aggregated through the numba engine.
+
+        Args:
+            config (dict): Pivot table configuration.
+
+        Returns:
+            bool: True if engine='numba' was requested and every aggregation function is a callable.
+        """
+        return self.engine == 'numba' and all(callable(func) for func in config['aggfunc'].values())
+
+    def _numba_pivot(self, config):
+        """
+        Build a pivot table with a groupby aggregation JIT-compiled by numba.
+
+        Args:
+            config (dict): Pivot table configuration with callable aggregation functions.
+
+        Returns:
+            pd.DataFrame: Pivot table equivalent to pd.pivot_table for the configuration.
+        """
+        # numba caches the compiled function, so only the first call pays the compilation cost
+        grouped = self.df.groupby(config['index'] + config['columns'], sort=False, observed=True)
+        engine_kwargs = {'nopython': True, 'nogil': True, 'parallel': True}
+        # Each value column gets its own callable, as pd.pivot_table applies an aggfunc dict
+        aggregated = pd.DataFrame({
+            val: grouped[val].agg(config['aggfunc'][val], engine='numba', engine_kwargs=engine_kwargs)
+            for val in config['values']
+        })
+        return self._reshape_pivot(aggregated, config['columns'])
+
+    def _use_pivot_kernel(self, config):
+        """
+        Check whether a configuration can be built by the compiled numba pivot kernel.
+
+        Args:
+            config (dict): Pivot table configuration.
+
+        Returns:
+            bool: True for engine='numba' with one row key, at most one column key and numeric value columns,
+                  aggregated by PIVOT_KERNEL_OPS (BINCOUNT_KERNEL_OPS if numba is not installed).
+        """
+        if self.engine != 'numba':
+            return False
+        supported = PIVOT_KERNEL_OPS if HAVE_NUMBA else BINCOUNT_KERNEL_OPS
+        return (len(config['index']) == 1 and len(config['columns']) <= 1
+                and all(isinstance(func, str) and func in supported for func in config['aggfunc'].values())
+                and all(self.df[val].dtype.kind in 'iuf' for val in config['values']))
+
+    def _kernel_pivot(self, config):
+        """
+        Build a pivot table by scattering values into a grid, with the compiled numba kernel when
+        numba is installed and with np.bincount otherwise.
+
+        Args:
+            config (dict): Pivot table configuration accepted by _use_pivot_kernel.
+
+        Returns:
+            pd.DataFrame: Pivot table equivalent to pd.pivot_table for the configuration.
+        """
+        row = config['index'][0]
+        idx_codes, idx_uniques = self._get_codes(row)
+        if config['columns']:
+            col = config['columns'][0]
+            col_codes, col_uniques = self._get_codes(col)
+        else:
+            col_codes, col_uniques = np.zeros(len(self.df), dtype=np.intp), None
+
+        kernel = _pivot_numba if HAVE_NUMBA else _pivot_bincount
+        blocks = []
+        for val in config['values']:
+            func = config['aggfunc'][val]
+            values = self.df[val].to_numpy(dtype='float64', na_value=np.nan)
+            grid = kernel(idx_codes, col_codes, values, len(idx_uniques),
+                                1 if col_uniques is None else len(col_uniques), PIVOT_KERNEL_OPS[func])
+            if col_uniques is None:
+                columns = pd.Index([val])
+            else:
+                columns = pd.MultiIndex.from_product([[val], col_uniques], names=[None, col])
+            block = pd.DataFrame(grid, index=pd.Index(idx_uniques, name=row), columns=columns)
+            result_dtype = self._kernel_result_dtype(func, self.df[val].dtype, grid)
+            blocks.append(block if result_dtype == np.float64 else block.astype(result_dtype))
+
+        # Blocks are built in config order; pd.pivot_table sorts the value level too
+        pivot_table = blocks[0] if len(blocks) == 1 else pd.concat(blocks, axis=1).sort_index(axis=1)
+        return pivot_table.dropna(how='all').dropna(axis=1, how='all')
+
+    @staticmethod
+    def _kernel_result_dtype(func, dtype, result):
+        """
+        Return the dtype pandas would give a pivot of the kernel's aggregation, which accumulates in float64.
+
+        Args:
+            func (str): Aggregation name from PIVOT_KERNEL_OPS.
+            dtype (np.dtype): Dtype of the value column.
+            result (np.ndarray): Aggregated cells as float64, NaN where a pivot cell is missing.
+
+        Returns:
+            np.dtype: Result dtype matching pd.pivot_table.
+        """
+        has_missing = bool(np.isnan(result).any())
+        if func == 'count':
+            return np.dtype(np.float64 if has_missing else np.int64)
+        if dtype.kind == 'f':
+            return dtype
+        # bool and extension integer dtypes (e.g. Int64) have no np.iinfo; keep the float64 accumulator
+        if has_missing or func == 'mean' or not isinstance(dtype, np.dtype) or not np.issubdtype(dtype, np.integer):
+            return np.dtype(np.float64)
+        if func == 'sum' and result.size:
+            # pandas sums integers in 64 bits and only narrows back when every total fits the input dtype
+            info = np.iinfo(dtype)
+            if result.min() < info.min or result.max() > info.max:
+                return np.dtype(np.uint64 if dtype.kind == 'u' else np.int64)
+        return dtype
+
+    def _get_codes(self, col):
+        """
+        Factorize a grouping column once and reuse the codes for every configuration that groups on it.
+
+        Args:
+            col (str): Column to factorize.
+
+        Returns:
+            tuple: (codes, uniques) as returned by pd.factorize with sorted uniques.
+        """
+        # The entry holds its source frame, so codes from a replaced self.df are never reused
+        entry = self._codes.get(col)
+        if entry is None or entry[0] is not self.df:
+            entry = self._codes[col] = (self.df, *pd.factorize(self.df[col], sort=True))
+        return entry[1], entry[2]
+
+    def _ensure_categorical(self):
+        """
+        Cast the candidate row/column fields of the stored DataFrame to category dtype once,
+        so every later grouping works on small integer codes instead of rehashing the raw values.
+        """
+        to_cast = [col for col in self.potential_rows_cols
+                   if col in self.df.columns and not isinstance(self.df[col].dtype, pd.CategoricalDtype)]
+        if to_cast:
+            self.df = self.df.astype({col: 'category' for col in to_cast})
+
+    @staticmethod
+    def _is_single_aggfunc(config):
+        """
+        Check whether every value column of a configuration uses a single named aggregation.
+
+        Args:
+            config (dict): Pivot table configuration.
+
+        Returns:
+            bool: True if every aggfunc is a string such as 'sum', 'mean' or 'count'.
+        """
+        return all(isinstance(func, str) for func in config['aggfunc'].values())
+
+    def _uses_batch(self, config):
+        """Check whether a configuration is built from a shared groupby.agg batch rather than a kernel or PivotTable."""
+        return self._is_single_aggfunc(config) and not self._use_pivot_kernel(config)
+
+    def _group_key(self, config):
+        """
+        Return the key of the aggregation batch a configuration belongs to.
+
+        Configurations whose aggfuncs can be rolled up share a batch across all their column variants
+        (the columns slot is None); any other configuration is batched with its exact columns.
+        """
+        if all(func in ROLLUP_AGGFUNCS or func == 'mean' for func in config['aggfunc'].values()):
+            columns = None
+        else:
+            columns = tuple(config['columns'])
+        return (id(self.df), tuple(config['index']), columns, tuple(config['values']))
+
+    def _get_grouped(self, key, plan):
+        """
+        Return a cached groupby so every configuration in a batch shares one grouping pass.
+
+        Args:
+            key (tuple): Batch key from _group_key.
+            plan (dict): The batch's entry from _plan_aggregation_batches.
+
+        Returns:
+            pd.core.groupby.DataFrameGroupBy: Grouping of the value columns by the row keys and the batch's column keys.
+        """
+        cache_key = key + (tuple(plan['columns']), plan['rollup'])
+        grouped = self._grouped_cache.get(cache_key)
+        if grouped is None:
+            # The GroupBy object keeps its factorized group codes, so later aggregations skip the hashing.
+            # Rolled-up batches keep null keys so rows missing only an unused column dimension still count.
+            index, values = list(key[1]), list(key[3])
+            grouped = self.df.groupby(index + plan['columns'], sort=False, observed=True,
+                                      dropna=not plan['rollup'])[values]
+            self._grouped_cache[cache_key] = grouped
+        return grouped
+
+    def _plan_aggregation_batches(self, configs):
+        """
+        Collect the groupings and named aggregations each batch needs across a set of configurations.
+
+        Configurations that share rows and values but differ in columns are grouped once by the union of
+        their column fields; each variant is later rolled up from that finer aggregation.
+
+        Args:
+            configs (iterable): Pivot table configurations accepted by _uses_batch.
+
+        Returns:
+            dict: Maps each batch key to {'columns': [...], 'funcs': {value column: [aggfunc, ...]}, 'rollup': bool},
+                  where 'funcs' feeds a single groupby.agg call.
+        """
+        plan = {}
+        for config in configs:
+            batch = plan.setdefault(self._group_key(config), {'columns': [], 'variants': set(), 'requested': {}})
+            batch['variants'].add(tuple(config['columns']))
+            batch['columns'] += [col for col in config['columns'] if col not in batch['columns']]
+            for val, func in config['aggfunc'].items():
+                batch['requested'].setdefault(val, []).append(func)
+
+        for batch in plan.values():
+            batch['rollup'] = len(batch.pop('variants')) > 1
+            batch['funcs'] = {}
+            for val, requested in batch.pop('requested').items():
+                if batch['rollup']:
+                    # Partial aggregates must combine; mean is rebuilt from sum and count
+                    requested = [part for func in requested for part in (['sum', 'count'] if func == 'mean' else [func])]
+                batch['funcs'][val] = list(dict.fromkeys(requested))
+        return plan
+
+    @staticmethod
+    def _rollup(aggregated, config):
+        """
+        Combine a batch's finer aggregation into the row and column keys of one configuration.
+
+        Args:
+            aggregated (pd.DataFrame): Batch aggregation with (value, aggfunc) columns, indexed by every column field.
+            config (dict): Pivot table configuration in the batch.
+
+        Returns:
+            pd.DataFrame: Aggregation indexed by the configuration's own keys, one column per value.
+        """
+        levels = config['index'] + config['columns']
+
+        def combine(val, func, how):
+            # Grouping drops null keys here, as a direct groupby on these keys would
+            return aggregated[(val, func)].groupby(level=levels, sort=False, observed=True).agg(how)
+
+        result = {}
+        for val in config['values']:
+            func = config['aggfunc'][val]
+            if func == 'mean':
+                total = combine(val, 'sum', 'sum')
+                mean = total / combine(val, 'count', 'sum')
+                result[val] = mean.astype(total.dtype) if total.dtype.kind == 'f' else mean
+            else:
+                result[val] = combine(val, func, ROLLUP_AGGFUNCS[func])
+        return pd.DataFrame(result)
+
+    @staticmethod
+    def _reshape_pivot(aggregated, columns):
+        """
+        Turn a grouped aggregation into pivot table layout, mirroring pd.pivot_table's defaults.
+
+        Args:
+            aggregated (pd.DataFrame): Aggregation indexed by the row and column keys.
+            columns (list): Grouping keys to move into the column axis.
+
+        Returns:
+            pd.DataFrame: Pivot table with sorted axes and all-NaN rows and columns dropped.
+        """
+        pivot_table = aggregated.dropna(how='all')
+        if columns:
+            pivot_table = pivot_table.unstack(columns).dropna(axis=1, how='all')
+        return pivot_table.sort_index().sort_index(axis=1)
+
     def generate_titles(self):
         """
         Generate intelligent titles for the most recent pivot table configurations.
@@ -844,18 +1764,36 @@ class PivotTable_AutoConfig:
         if not self.last_configs:
             raise ValueError("No configurations available. Run generate_configurations or generate_triple_aggfunc_configurations first.")
 
-        titles = []
-        for config in self.last_configs:
-            index_name = config['index'][0] if config['index'] else "All"
-            columns_name = f" by {config['columns'][0]}" if config['columns'] else ""
-            values_name = config['values'][0]
-            aggfunc = list(config['aggfunc'].values())[0]  # Get the aggfunc for the value column
+        configs = self.last_configs
+        if isinstance(configs, ConfigBatch):
+            fields = list(zip(configs.values, configs.aggfunc, configs.index, configs.columns))
+        else:
+            # Configurations were assigned directly as dicts rather than generated here
+            fields = list(map(self._title_fields, configs))
+
+        # Only a handful of distinct aggfuncs occur, so each is capitalized once
+        agg_cap = {aggfunc: aggfunc.capitalize() for _, aggfunc, _, _ in fields}
+        title = "{} {} {}".format
+        title_by = "{} {} {} by {}".format
+        return [title(values_name, agg_cap[aggfunc], index_name) if columns_name is None
+                else title_by(values_name, agg_cap[aggfunc], index_name, columns_name)
+                for values_name, aggfunc, index_name, columns_name in fields]
+
+    @staticmethod
+    def _title_fields(config):
+        """
+        Extract the fields a title is built from.
 
-            # Construct the title
-            title = f"{values_name} {aggfunc.capitalize()} {index_name}{columns_name}"
-            titles.append(title)
+        Args:
+            config (dict): Pivot table configuration.
 
-        return titles
+        Returns:
+            tuple: (value column, aggfunc, index column or "All", column field or None).
+        """
+        index_name = config['index'][0] if config['index'] else "All"
+        columns_name = config['columns'][0] if config['columns'] else None
+        aggfunc = next(iter(config['aggfunc'].values()))  # Get the aggfunc for the value column
+        return config['values'][0], aggfunc, index_name, columns_name
 
 
 